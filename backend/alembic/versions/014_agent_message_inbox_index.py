@@ -0,0 +1,35 @@
+"""Widen the agent_messages inbox index to cover the delivery order
+
+Revision ID: 014_agent_message_inbox_index
+Revises: 013_add_simulation_tables
+Create Date: 2026-10-17
+
+MessageBus.receive_messages filters on (to_agent, processed) and orders
+by (priority, sent_at). Extending the composite index with the sort
+columns lets the database return the first N messages straight off the
+index instead of sorting the whole inbox.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '014_agent_message_inbox_index'
+down_revision: Union[str, None] = '013_add_simulation_tables'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_agent_message_to_processed', 'agent_messages')
+    op.create_index(
+        'ix_agent_message_inbox',
+        'agent_messages',
+        ['to_agent', 'processed', 'priority', 'sent_at']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_agent_message_inbox', 'agent_messages')
+    op.create_index('ix_agent_message_to_processed', 'agent_messages', ['to_agent', 'processed'])
@@ -5,6 +5,7 @@ from app.ai_agents.base_agent import BaseAgent
 from app.models.ai_agent import AgentRole, DecisionType
 from app.models.signal import Signal, SignalType
 from app.models.position import Position, PositionStatus
+import enum
 import logging
 
 logger = logging.getLogger(__name__)
@@ -21,6 +22,14 @@ HARD_CAPS = {
 }
 
 
+class RejectReason(str, enum.Enum):
+    """Why validate_signal rejected a signal."""
+    MAX_OPEN_POSITIONS = "max_open_positions"
+    DAILY_TRADE_LIMIT = "daily_trade_limit"
+    INVALID_POSITION_SIZE = "invalid_position_size"
+    LOW_RISK_REWARD = "low_risk_reward"
+
+
 class RiskAgent(BaseAgent):
     """
     Risk management and enforcement agent.
@@ -49,12 +58,14 @@ class RiskAgent(BaseAgent):
             account_balance: Current account balance
 
         Returns:
-            Validation result with approved flag and position size
+            Validation result with approved flag and position size;
+            rejections also carry a RejectReason in "reason_code"
         """
         validation = {
             "approved": False,
             "position_size": 0.0,
             "reason": "",
+            "reason_code": None,
             "checks": {}
         }
 
@@ -70,6 +81,7 @@ class RiskAgent(BaseAgent):
         }
 
         if open_positions >= HARD_CAPS["max_open_positions"]:
+            validation["reason_code"] = RejectReason.MAX_OPEN_POSITIONS
             validation["reason"] = f"Max open positions reached ({open_positions}/{HARD_CAPS['max_open_positions']})"
             await self._log_rejection(signal, validation["reason"])
             return validation
@@ -87,6 +99,7 @@ class RiskAgent(BaseAgent):
         }
 
         if today_trades >= HARD_CAPS["max_trades_per_day"]:
+            validation["reason_code"] = RejectReason.DAILY_TRADE_LIMIT
             validation["reason"] = f"Daily trade limit reached ({today_trades}/{HARD_CAPS['max_trades_per_day']})"
             await self._log_rejection(signal, validation["reason"])
             return validation
@@ -110,6 +123,7 @@ class RiskAgent(BaseAgent):
             logger.warning(f"Position size capped at {HARD_CAPS['max_order_size']} lots")
 
         if position_size <= 0:
+            validation["reason_code"] = RejectReason.INVALID_POSITION_SIZE
             validation["reason"] = "Invalid position size (≤0)"
             await self._log_rejection(signal, validation["reason"])
             return validation
@@ -124,6 +138,7 @@ class RiskAgent(BaseAgent):
         }
 
         if rr_ratio < 1.5:
+            validation["reason_code"] = RejectReason.LOW_RISK_REWARD
             validation["reason"] = f"R:R ratio too low ({rr_ratio:.2f} < 1.5)"
             await self._log_rejection(signal, validation["reason"])
             return validation
@@ -1,4 +1,5 @@
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Tuple
 from sqlalchemy import select
 from app.ai_agents.base_agent import BaseAgent
 from app.models.ai_agent import AgentRole, DecisionType, SystemMode, SystemConfig
@@ -17,6 +18,28 @@ HARD_CAPS = {
     "emergency_drawdown_stop": 15.0,     # % triggers full stop
 }
 
+# Hard caps should never be modified at runtime
+# This is a safety check
+_EXPECTED_HARD_CAPS = {
+    "max_risk_per_trade": 2.0,
+    "max_daily_loss": 5.0,
+    "max_trades_per_day": 20,
+    "max_open_positions": 10,
+    "max_order_size": 1.0,
+    "emergency_drawdown_stop": 15.0,
+}
+
+
+@lru_cache(maxsize=8)
+def _hard_cap_violations(caps: Tuple[Tuple[str, Any], ...]) -> Tuple[str, ...]:
+    """Violations for a snapshot of HARD_CAPS items (a changed cap is a new key)."""
+    current = dict(caps)
+    return tuple(
+        f"{key} modified: {current.get(key)} != {expected_value}"
+        for key, expected_value in _EXPECTED_HARD_CAPS.items()
+        if current.get(key) != expected_value
+    )
+
 
 class SupervisorAgent(BaseAgent):
     """
@@ -74,29 +97,14 @@ class SupervisorAgent(BaseAgent):
         Returns:
             Verification result with all hard caps
         """
+        violations = _hard_cap_violations(tuple(HARD_CAPS.items()))
         verification = {
-            "verified": True,
+            "verified": not violations,
             "hard_caps": HARD_CAPS,
             "immutable": True,
-            "violations": []
-        }
-
-        # Hard caps should never be modified at runtime
-        # This is a safety check
-        expected_caps = {
-            "max_risk_per_trade": 2.0,
-            "max_daily_loss": 5.0,
-            "max_trades_per_day": 20,
-            "max_open_positions": 10,
-            "max_order_size": 1.0,
-            "emergency_drawdown_stop": 15.0,
+            "violations": list(violations)
         }
 
-        for key, expected_value in expected_caps.items():
-            if HARD_CAPS.get(key) != expected_value:
-                verification["verified"] = False
-                verification["violations"].append(f"{key} modified: {HARD_CAPS.get(key)} != {expected_value}")
-
         await self.log_decision(
             decision_type=DecisionType.MODE_ENFORCEMENT,
             decision="Hard caps verification",
@@ -6,10 +6,30 @@ Prompt 05 - Backtest Engine.
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import NamedTuple, Optional
 import math
 
-from app.backtest.portfolio import Portfolio, EquityPoint, Trade
+import numpy as np
+
+from app.backtest.portfolio import Portfolio, Trade
+
+
+class _TradeArrays(NamedTuple):
+    """Per-trade columns pulled out of a trade list in a single pass."""
+    pnl: np.ndarray
+    durations: np.ndarray  # timedelta64[us]
+    
+    @classmethod
+    def from_trades(cls, trades: list[Trade]) -> "_TradeArrays":
+        """Build the column arrays, touching each Trade once."""
+        n = len(trades)
+        pnl = np.empty(n, dtype=np.float64)
+        # Subtract as timedeltas so tz-aware and naive timestamps both work
+        durations = np.empty(n, dtype="timedelta64[us]")
+        for i, trade in enumerate(trades):
+            pnl[i] = trade.pnl
+            durations[i] = trade.exit_time - trade.entry_time
+        return cls(pnl, durations)
 
 
 @dataclass
@@ -75,37 +95,47 @@ class PerformanceMetrics:
         total_return = portfolio.total_return
         total_pnl = portfolio.total_pnl
         
-        # Drawdown metrics
-        max_drawdown = portfolio.max_drawdown
-        avg_drawdown = cls._calculate_avg_drawdown(portfolio.equity_curve)
+        # Equity curve as one array, shared by the drawdown and returns calculations
+        equity = np.fromiter(
+            (ep.equity for ep in portfolio.equity_curve),
+            dtype=np.float64,
+            count=len(portfolio.equity_curve),
+        )
+        
+        # Drawdown metrics (running peak starts at the initial balance, as in update_equity)
+        drawdowns = Portfolio.drawdowns_from_equity(equity, portfolio.initial_balance)
+        max_drawdown = float(drawdowns.max()) if drawdowns.size else 0.0
+        avg_drawdown = cls._calculate_avg_drawdown(drawdowns)
         
         # Calculate returns series for Sharpe/Sortino
-        returns = cls._calculate_returns_series(portfolio.equity_curve)
+        returns = cls._calculate_returns_series(equity)
         
         # Risk-adjusted returns
         sharpe_ratio = cls._calculate_sharpe_ratio(returns, risk_free_rate)
         sortino_ratio = cls._calculate_sortino_ratio(returns, risk_free_rate)
         
-        # Trade statistics
-        total_trades = len(portfolio.trades)
-        winning_trades = len(portfolio.winning_trades)
-        losing_trades = len(portfolio.losing_trades)
-        win_rate = portfolio.win_rate
+        # Trade statistics (same win/loss split as Portfolio.winning_trades/losing_trades)
+        trade_arrays = _TradeArrays.from_trades(portfolio.trades)
+        pnl = trade_arrays.pnl
+        total_trades = pnl.size
+        winning_trades = int(np.count_nonzero(pnl > 0))
+        losing_trades = total_trades - winning_trades
+        win_rate = winning_trades / total_trades if total_trades else 0.0
         
         # Profit factor
-        profit_factor = cls._calculate_profit_factor(portfolio.trades)
+        profit_factor = cls._calculate_profit_factor(pnl)
         
         # Average win/loss
-        avg_win, avg_loss = cls._calculate_avg_win_loss(portfolio.trades)
+        avg_win, avg_loss = cls._calculate_avg_win_loss(pnl)
         
         # Largest win/loss
-        largest_win, largest_loss = cls._calculate_largest_win_loss(portfolio.trades)
+        largest_win, largest_loss = cls._calculate_largest_win_loss(pnl)
         
         # Expectancy
         expectancy = cls._calculate_expectancy(win_rate, avg_win, avg_loss)
         
         # Average trade duration
-        avg_trade_duration = cls._calculate_avg_trade_duration(portfolio.trades)
+        avg_trade_duration = cls._calculate_avg_trade_duration(trade_arrays.durations)
         
         # Recovery factor
         recovery_factor = cls._calculate_recovery_factor(total_pnl, max_drawdown, portfolio.initial_balance)
@@ -132,34 +162,24 @@ class PerformanceMetrics:
         )
     
     @staticmethod
-    def _calculate_returns_series(equity_curve: list[EquityPoint]) -> list[float]:
+    def _calculate_returns_series(equity: np.ndarray) -> np.ndarray:
         """
         Calculate period-over-period returns from equity curve.
         
         Args:
-            equity_curve: List of equity points
+            equity: Equity values in curve order
             
         Returns:
-            List of percentage returns
+            Array of percentage returns (periods starting from non-positive equity are skipped)
         """
-        if len(equity_curve) < 2:
-            return []
-        
-        returns = []
-        for i in range(1, len(equity_curve)):
-            prev_equity = equity_curve[i - 1].equity
-            curr_equity = equity_curve[i].equity
-            
-            if prev_equity > 0:
-                ret = (curr_equity - prev_equity) / prev_equity
-                returns.append(ret)
-        
-        return returns
+        prev_equity = equity[:-1]
+        valid = prev_equity > 0
+        return np.diff(equity)[valid] / prev_equity[valid]
     
     @classmethod
     def _calculate_sharpe_ratio(
         cls,
-        returns: list[float],
+        returns: list[float] | np.ndarray,
         risk_free_rate: float
     ) -> Optional[float]:
         """
@@ -177,11 +197,11 @@ class PerformanceMetrics:
         if len(returns) < 2:
             return None
         
-        mean_return = sum(returns) / len(returns)
+        arr = np.asarray(returns, dtype=np.float64)
+        mean_return = arr.mean()
         
-        # Calculate standard deviation
-        variance = sum((r - mean_return) ** 2 for r in returns) / len(returns)
-        std_dev = math.sqrt(variance)
+        # Population standard deviation
+        std_dev = arr.std()
         
         if std_dev == 0:
             return None
@@ -192,12 +212,12 @@ class PerformanceMetrics:
         # Annualized Sharpe ratio
         sharpe = (mean_return - daily_rf) / std_dev * math.sqrt(cls.TRADING_DAYS_PER_YEAR)
         
-        return sharpe
+        return float(sharpe)
     
     @classmethod
     def _calculate_sortino_ratio(
         cls,
-        returns: list[float],
+        returns: list[float] | np.ndarray,
         risk_free_rate: float
     ) -> Optional[float]:
         """
@@ -216,16 +236,17 @@ class PerformanceMetrics:
         if len(returns) < 2:
             return None
         
-        mean_return = sum(returns) / len(returns)
+        arr = np.asarray(returns, dtype=np.float64)
+        mean_return = arr.mean()
         
         # Calculate downside deviation (only negative returns)
-        negative_returns = [r for r in returns if r < 0]
+        negative_returns = arr[arr < 0]
         
-        if not negative_returns:
+        if negative_returns.size == 0:
             # No negative returns - excellent performance, but can't calculate
             return None
         
-        downside_variance = sum(r ** 2 for r in negative_returns) / len(returns)
+        downside_variance = np.dot(negative_returns, negative_returns) / arr.size
         downside_dev = math.sqrt(downside_variance)
         
         if downside_dev == 0:
@@ -237,84 +258,80 @@ class PerformanceMetrics:
         # Annualized Sortino ratio
         sortino = (mean_return - daily_rf) / downside_dev * math.sqrt(cls.TRADING_DAYS_PER_YEAR)
         
-        return sortino
+        return float(sortino)
     
     @staticmethod
-    def _calculate_avg_drawdown(equity_curve: list[EquityPoint]) -> float:
+    def _calculate_avg_drawdown(drawdowns: np.ndarray) -> float:
         """
-        Calculate average drawdown from equity curve.
+        Calculate average drawdown over the bars that are below peak.
         
         Args:
-            equity_curve: List of equity points
+            drawdowns: Per-bar drawdowns as decimals
             
         Returns:
             Average drawdown as a decimal
         """
-        if not equity_curve:
-            return 0.0
-        
-        drawdowns = [ep.drawdown for ep in equity_curve if ep.drawdown > 0]
+        underwater = drawdowns[drawdowns > 0]
         
-        if not drawdowns:
+        if underwater.size == 0:
             return 0.0
         
-        return sum(drawdowns) / len(drawdowns)
+        return float(underwater.mean())
     
     @staticmethod
-    def _calculate_profit_factor(trades: list[Trade]) -> Optional[float]:
+    def _calculate_profit_factor(pnl: np.ndarray) -> Optional[float]:
         """
         Calculate profit factor (gross profits / gross losses).
         
         Args:
-            trades: List of completed trades
+            pnl: Per-trade P&L array
             
         Returns:
             Profit factor or None if no losing trades
         """
-        gross_profit = sum(t.pnl for t in trades if t.pnl > 0)
-        gross_loss = abs(sum(t.pnl for t in trades if t.pnl < 0))
+        gross_profit = pnl[pnl > 0].sum()
+        gross_loss = -pnl[pnl < 0].sum()
         
         if gross_loss == 0:
             return None  # Infinite profit factor
         
-        return gross_profit / gross_loss
+        return float(gross_profit / gross_loss)
     
     @staticmethod
-    def _calculate_avg_win_loss(trades: list[Trade]) -> tuple[float, float]:
+    def _calculate_avg_win_loss(pnl: np.ndarray) -> tuple[float, float]:
         """
         Calculate average winning and losing trade P&L.
         
         Args:
-            trades: List of completed trades
+            pnl: Per-trade P&L array
             
         Returns:
             Tuple of (avg_win, avg_loss)
         """
-        winners = [t.pnl for t in trades if t.pnl > 0]
-        losers = [t.pnl for t in trades if t.pnl < 0]
+        winners = pnl[pnl > 0]
+        losers = pnl[pnl < 0]
         
-        avg_win = sum(winners) / len(winners) if winners else 0.0
-        avg_loss = abs(sum(losers) / len(losers)) if losers else 0.0
+        avg_win = float(winners.mean()) if winners.size else 0.0
+        avg_loss = float(-losers.mean()) if losers.size else 0.0
         
         return avg_win, avg_loss
     
     @staticmethod
-    def _calculate_largest_win_loss(trades: list[Trade]) -> tuple[float, float]:
+    def _calculate_largest_win_loss(pnl: np.ndarray) -> tuple[float, float]:
         """
         Find largest winning and losing trades.
         
         Args:
-            trades: List of completed trades
+            pnl: Per-trade P&L array
             
         Returns:
             Tuple of (largest_win, largest_loss)
         """
-        if not trades:
+        if pnl.size == 0:
             return 0.0, 0.0
         
-        pnls = [t.pnl for t in trades]
-        largest_win = max(pnls) if pnls else 0.0
-        largest_loss = abs(min(pnls)) if pnls else 0.0
+        largest_win = float(pnl.max())
+        largest_loss = abs(float(pnl.min()))
         
         return max(0.0, largest_win), largest_loss
     
@@ -336,25 +353,20 @@ class PerformanceMetrics:
         return (win_rate * avg_win) - ((1 - win_rate) * avg_loss)
     
     @staticmethod
-    def _calculate_avg_trade_duration(trades: list[Trade]) -> float:
+    def _calculate_avg_trade_duration(durations: np.ndarray) -> float:
         """
         Calculate average trade duration in hours.
         
         Args:
-            trades: List of completed trades
+            durations: Per-trade timedelta64 durations
             
         Returns:
             Average duration in hours
         """
-        if not trades:
+        if durations.size == 0:
             return 0.0
         
-        durations = []
-        for trade in trades:
-            duration = trade.exit_time - trade.entry_time
-            durations.append(duration.total_seconds() / 3600)  # Convert to hours
-        
-        return sum(durations) / len(durations)
+        return float(durations.mean() / np.timedelta64(1, "h"))
     
     @staticmethod
     def _calculate_recovery_factor(
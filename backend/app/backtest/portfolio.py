@@ -11,6 +11,8 @@ from enum import Enum
 from typing import Optional
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,7 +22,7 @@ class TradeSide(str, Enum):
     SHORT = "SHORT"
 
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     """
     Represents a completed (closed) trade.
@@ -69,12 +71,16 @@ class OpenPosition:
     stop_loss: Optional[float] = None
     take_profit: Optional[float] = None
     
+    # +1 for LONG, -1 for SHORT; P&L is sign * price move * quantity
+    sign: int = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        """Precompute the direction multiplier from side."""
+        self.sign = 1 if self.side == TradeSide.LONG else -1
+    
     def unrealized_pnl(self, current_price: float) -> float:
         """Calculate unrealized P&L at current price."""
-        if self.side == TradeSide.LONG:
-            return (current_price - self.entry_price) * self.quantity
-        else:  # SHORT
-            return (self.entry_price - current_price) * self.quantity
+        return self.sign * (current_price - self.entry_price) * self.quantity
     
     def unrealized_pnl_percent(self, current_price: float) -> float:
         """Calculate unrealized P&L percentage."""
@@ -84,7 +90,7 @@ class OpenPosition:
         return self.unrealized_pnl(current_price) / position_value
 
 
-@dataclass
+@dataclass(slots=True)
 class EquityPoint:
     """
     A single point on the equity curve.
@@ -277,10 +283,7 @@ class Portfolio:
         Returns:
             Raw P&L amount
         """
-        if position.side == TradeSide.LONG:
-            return (exit_price - position.entry_price) * position.quantity
-        else:  # SHORT
-            return (position.entry_price - exit_price) * position.quantity
+        return position.sign * (exit_price - position.entry_price) * position.quantity
     
     def check_stop_loss_take_profit(
         self,
@@ -421,6 +424,12 @@ class Portfolio:
             return 0.0
         return max(ep.drawdown for ep in self.equity_curve)
     
+    @staticmethod
+    def drawdowns_from_equity(equity: np.ndarray, initial_peak: float = 0.0) -> np.ndarray:
+        """Get per-bar drawdowns from a raw equity array (vectorised running peak)."""
+        peak = np.maximum.accumulate(np.maximum(equity, initial_peak))
+        return np.divide(peak - equity, peak, out=np.zeros_like(equity), where=peak > 0)
+    
     def has_open_position(self, symbol: str) -> bool:
         """Check if there's an open position for a symbol."""
         return any(p.symbol == symbol for p in self.positions)
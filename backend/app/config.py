@@ -26,6 +26,7 @@ class Settings(BaseSettings):
     jwt_algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
     refresh_token_expire_days: int = 7
+    bcrypt_rounds: int = 12  # bcrypt cost factor (4-31); lower only for throwaway environments
     
     # Database
     database_url: str = "sqlite+aiosqlite:///./flowrex_dev.db"
@@ -46,6 +47,8 @@ class Settings(BaseSettings):
     twelvedata_api_key: str = ""
     twelvedata_base_url: str = "https://api.twelvedata.com"
     twelvedata_rate_limit: int = 8  # requests per minute for free tier
+    twelvedata_pool_limit: int = 32  # max open connections per client
+    twelvedata_keepalive_timeout: float = 60  # seconds an idle connection is kept
 
     @field_validator("app_secret_key", "jwt_secret_key", mode="before")
     @classmethod
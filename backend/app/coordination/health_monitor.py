@@ -10,7 +10,7 @@ Detects:
 from typing import Dict, Optional, List
 from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, case
 from app.models.coordination import AgentHealth
 import logging
 
@@ -43,27 +43,37 @@ class HealthMonitor:
             agent_name: Agent name
             response_time_ms: Response time in milliseconds
         """
-        stmt = select(AgentHealth).where(AgentHealth.agent_name == agent_name)
+        now = datetime.utcnow()
+
+        # Update existing in a single statement
+        total_ops = AgentHealth.success_count + AgentHealth.error_count
+        stmt = (
+            update(AgentHealth)
+            .where(AgentHealth.agent_name == agent_name)
+            .values(
+                last_heartbeat=now,
+                is_healthy=True,
+                # Update rolling average response time
+                avg_response_time_ms=case(
+                    (
+                        total_ops > 0,
+                        (AgentHealth.avg_response_time_ms * total_ops + response_time_ms) / (total_ops + 1)
+                    ),
+                    else_=AgentHealth.avg_response_time_ms
+                )
+            )
+            .returning(AgentHealth)
+            # RETURNING refreshes any AgentHealth already loaded in the session
+            .execution_options(synchronize_session="fetch")
+        )
         result = await self.db.execute(stmt)
-        health = result.scalar_one_or_none()
-
-        if health:
-            # Update existing
-            health.last_heartbeat = datetime.utcnow()
-            health.is_healthy = True
 
-            # Update rolling average response time
-            total_ops = health.success_count + health.error_count
-            if total_ops > 0:
-                health.avg_response_time_ms = (
-                    (health.avg_response_time_ms * total_ops + response_time_ms) / (total_ops + 1)
-                )
-        else:
+        if result.scalar_one_or_none() is None:
             # Create new
             health = AgentHealth(
                 agent_name=agent_name,
                 is_healthy=True,
-                last_heartbeat=datetime.utcnow(),
+                last_heartbeat=now,
                 avg_response_time_ms=response_time_ms,
                 error_count=0,
                 success_count=0
@@ -74,30 +84,42 @@ class HealthMonitor:
 
     async def record_success(self, agent_name: str):
         """Record successful agent operation."""
-        stmt = select(AgentHealth).where(AgentHealth.agent_name == agent_name)
+        stmt = (
+            update(AgentHealth)
+            .where(AgentHealth.agent_name == agent_name)
+            .values(success_count=AgentHealth.success_count + 1)
+            .returning(AgentHealth)
+            .execution_options(synchronize_session="fetch")
+        )
         result = await self.db.execute(stmt)
-        health = result.scalar_one_or_none()
 
-        if health:
-            health.success_count += 1
+        if result.scalar_one_or_none():
             await self.db.commit()
 
     async def record_error(self, agent_name: str, error_message: str):
         """Record agent error."""
-        stmt = select(AgentHealth).where(AgentHealth.agent_name == agent_name)
+        # SET expressions see the pre-update row, so these are the new totals
+        error_count = AgentHealth.error_count + 1
+        total_ops = AgentHealth.success_count + error_count
+        stmt = (
+            update(AgentHealth)
+            .where(AgentHealth.agent_name == agent_name)
+            .values(
+                error_count=error_count,
+                status_message=error_message,
+                # Mark unhealthy if error rate > 50%
+                is_healthy=case((error_count * 2 > total_ops, False), else_=AgentHealth.is_healthy)
+            )
+            .returning(AgentHealth)
+            .execution_options(synchronize_session="fetch")
+        )
         result = await self.db.execute(stmt)
         health = result.scalar_one_or_none()
 
         if health:
-            health.error_count += 1
-            health.status_message = error_message
-
-            # Mark unhealthy if error rate > 50%
-            total_ops = health.success_count + health.error_count
-            error_rate = health.error_count / total_ops if total_ops > 0 else 0
+            error_rate = health.error_count / (health.success_count + health.error_count)
 
             if error_rate > 0.5:
-                health.is_healthy = False
                 logger.error(f"Agent {agent_name} marked unhealthy (error rate: {error_rate:.2%})")
 
             await self.db.commit()
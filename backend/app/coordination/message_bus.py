@@ -185,18 +185,26 @@ class MessageBus:
             reason: Halt reason
         """
         agents = ["supervisor", "strategy", "risk", "execution"]
-
-        for agent in agents:
-            if agent != from_agent:
-                await self.send_message(
-                    from_agent=from_agent,
-                    to_agent=agent,
-                    message_type=MessageType.HALT,
-                    subject="EMERGENCY HALT",
-                    payload={"reason": reason, "timestamp": datetime.utcnow().isoformat()},
-                    priority=MessagePriority.CRITICAL,
-                    expires_in_seconds=60
-                )
+        now = datetime.utcnow()
+        expires_at = now + timedelta(seconds=60)
+
+        # One commit for the whole broadcast instead of one per recipient
+        self.db.add_all([
+            AgentMessage(
+                from_agent=from_agent,
+                to_agent=agent,
+                message_type=MessageType.HALT,
+                priority=MessagePriority.CRITICAL,
+                subject="EMERGENCY HALT",
+                payload={"reason": reason, "timestamp": now.isoformat()},
+                processed=False,
+                sent_at=now,
+                expires_at=expires_at
+            )
+            for agent in agents
+            if agent != from_agent
+        ])
+        await self.db.commit()
 
         logger.critical(f"HALT broadcast from {from_agent}: {reason}")
 
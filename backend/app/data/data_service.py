@@ -2,6 +2,8 @@ from typing import List, Optional
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from app.models.market_data import Candle, Symbol, EconomicEvent
 from app.data.twelvedata_client import TwelveDataClient
 import logging
@@ -9,6 +11,13 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+# Dialect-specific INSERT constructs that support ON CONFLICT DO NOTHING
+_INSERTS = {"postgresql": pg_insert, "sqlite": sqlite_insert}
+
+# Rows per INSERT statement; keeps bound parameters under SQLite's limit
+_INSERT_CHUNK_SIZE = 1000
+
+
 class DataService:
     """Service for fetching and storing market data."""
 
@@ -29,7 +38,14 @@ class DataService:
 
         Returns:
             Number of candles inserted
+
+        Raises:
+            NotImplementedError: If the database dialect has no ON CONFLICT insert
         """
+        dialect = self.db.get_bind().dialect.name
+        if dialect not in _INSERTS:
+            raise NotImplementedError(f"Candle upserts are not supported on the {dialect!r} dialect")
+
         candles_data = await self.client.get_time_series(
             symbol=symbol,
             interval=interval,
@@ -42,35 +58,30 @@ class DataService:
             logger.warning(f"No candles fetched for {symbol} {interval}")
             return 0
 
+        rows = [
+            {
+                "symbol": symbol,
+                "interval": interval,
+                "timestamp": candle_dict["datetime"],
+                "open": candle_dict["open"],
+                "high": candle_dict["high"],
+                "low": candle_dict["low"],
+                "close": candle_dict["close"],
+                "volume": candle_dict["volume"],
+                "source": "twelvedata",
+            }
+            for candle_dict in candles_data
+        ]
+
+        # Let the unique constraint drop already-stored candles instead of checking first
+        insert = _INSERTS[dialect]
         inserted_count = 0
-        for candle_dict in candles_data:
-            # Check if candle already exists
-            stmt = select(Candle).where(
-                and_(
-                    Candle.symbol == symbol,
-                    Candle.interval == interval,
-                    Candle.timestamp == candle_dict["datetime"]
-                )
+        for i in range(0, len(rows), _INSERT_CHUNK_SIZE):
+            stmt = insert(Candle).values(rows[i:i + _INSERT_CHUNK_SIZE]).on_conflict_do_nothing(
+                index_elements=["symbol", "interval", "timestamp"]
             )
             result = await self.db.execute(stmt)
-            existing = result.scalar_one_or_none()
-
-            if existing:
-                continue
-
-            candle = Candle(
-                symbol=symbol,
-                interval=interval,
-                timestamp=candle_dict["datetime"],
-                open=candle_dict["open"],
-                high=candle_dict["high"],
-                low=candle_dict["low"],
-                close=candle_dict["close"],
-                volume=candle_dict["volume"],
-                source="twelvedata"
-            )
-            self.db.add(candle)
-            inserted_count += 1
+            inserted_count += result.rowcount
 
         await self.db.commit()
         logger.info(f"Inserted {inserted_count} candles for {symbol} {interval}")
@@ -1,6 +1,7 @@
 import aiohttp
 import asyncio
 import logging
+import time
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta, timezone
 from aiohttp_retry import RetryClient, ExponentialRetry
@@ -12,34 +13,37 @@ logger = logging.getLogger(__name__)
 
 
 class RateLimiter:
-    """Token bucket rate limiter for TwelveData API."""
+    """Token bucket rate limiter for TwelveData API, refilled lazily on acquire."""
 
     def __init__(self, max_requests: int, time_window: int = 60):
         self.max_requests = max_requests
         self.time_window = time_window
-        self.tokens = max_requests
-        self.last_refill = datetime.now(timezone.utc)
+        self.rate = max_requests / time_window  # tokens per second
+        self.tokens = float(max_requests)
+        self.last_refill = time.monotonic()
         self._lock = asyncio.Lock()
 
+    def _refill(self):
+        """Credit the tokens earned since the last refill, up to capacity."""
+        now = time.monotonic()
+        self.tokens = min(self.max_requests, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
     async def acquire(self):
         """Wait until a token is available."""
-        async with self._lock:
-            now = datetime.now(timezone.utc)
-            elapsed = (now - self.last_refill).total_seconds()
+        while True:
+            async with self._lock:
+                self._refill()
 
-            if elapsed > self.time_window:
-                self.tokens = self.max_requests
-                self.last_refill = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
 
-            if self.tokens <= 0:
-                wait_time = self.time_window - elapsed
-                if wait_time > 0:
-                    logger.warning(f"Rate limit reached. Waiting {wait_time:.2f}s")
-                    await asyncio.sleep(wait_time)
-                    self.tokens = self.max_requests
-                    self.last_refill = datetime.now(timezone.utc)
+                wait_time = (1 - self.tokens) / self.rate
 
-            self.tokens -= 1
+            # Sleep outside the lock so other callers are not queued behind us
+            logger.warning(f"Rate limit reached. Waiting {wait_time:.2f}s")
+            await asyncio.sleep(wait_time)
 
 
 class TwelveDataClient:
@@ -64,7 +68,14 @@ class TwelveDataClient:
         """Initialize HTTP session and Redis connection."""
         if not self._session:
             timeout = aiohttp.ClientTimeout(total=30)
-            self._session = aiohttp.ClientSession(timeout=timeout)
+            # Rate-limited calls can sit idle past aiohttp's 15s keep-alive default, so
+            # keep idle connections longer; the rate limit keeps concurrency low, so cap
+            # the pool below aiohttp's default of 100
+            connector = aiohttp.TCPConnector(
+                limit=settings.twelvedata_pool_limit,
+                keepalive_timeout=settings.twelvedata_keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(timeout=timeout, connector=connector)
 
             retry_options = ExponentialRetry(attempts=3, start_timeout=1, max_timeout=10)
             self._retry_client = RetryClient(
@@ -206,7 +217,7 @@ class TwelveDataClient:
             try:
                 dt_str = item["datetime"]
                 if "Z" in dt_str:
-                    dt = datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
+                    dt = datetime.fromisoformat(dt_str)
                 elif "+" in dt_str or dt_str.endswith("-00:00"):
                     dt = datetime.fromisoformat(dt_str)
                 else:
@@ -247,7 +258,7 @@ class TwelveDataClient:
 
         dt_str = data["datetime"]
         if "Z" in dt_str:
-            dt = datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
+            dt = datetime.fromisoformat(dt_str)
         elif "+" in dt_str or dt_str.endswith("-00:00"):
             dt = datetime.fromisoformat(dt_str)
         else:
@@ -311,7 +322,7 @@ class TwelveDataClient:
             if "datetime" in data:
                 dt_str = data["datetime"]
                 if "Z" in dt_str:
-                    return datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
+                    return datetime.fromisoformat(dt_str)
                 return datetime.fromisoformat(dt_str).replace(tzinfo=timezone.utc)
         except Exception as e:
             logger.warning(f"Could not get earliest timestamp for {symbol}: {e}")
@@ -75,7 +75,8 @@ class AgentMessage(Base, TimestampMixin):
     expires_at: Mapped[Optional[datetime]] = mapped_column(nullable=True)
 
     __table_args__ = (
-        Index("ix_agent_message_to_processed", "to_agent", "processed"),
+        # Covers receive_messages: filter on recipient/processed, ordered by priority then sent_at
+        Index("ix_agent_message_inbox", "to_agent", "processed", "priority", "sent_at"),
     )
 
     def __repr__(self) -> str:
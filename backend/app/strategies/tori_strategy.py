@@ -48,8 +48,7 @@ class ToriStrategy(BaseStrategy):
         signals = []
 
         # Identify swing points
-        swing_highs = self._find_swing_highs(candles, lookback)
-        swing_lows = self._find_swing_lows(candles, lookback)
+        swing_highs, swing_lows = self._find_swings(candles, lookback)
 
         # Calculate trendlines
         uptrend_line = self._calculate_trendline(swing_lows, candles)
@@ -105,37 +104,37 @@ class ToriStrategy(BaseStrategy):
 
         return signals
 
-    def _find_swing_highs(self, candles: List[Candle], lookback: int) -> List[Tuple[int, float]]:
-        """Find swing high points (index, price)."""
+    def _find_swings(
+        self,
+        candles: List[Candle],
+        lookback: int
+    ) -> Tuple[List[Tuple[int, float]], List[Tuple[int, float]]]:
+        """Find swing high and swing low points (index, price) in a single pass."""
         swing_highs = []
-
-        for i in range(lookback, len(candles) - lookback):
-            is_swing_high = True
-            for j in range(i - lookback, i + lookback + 1):
-                if j != i and candles[j].high >= candles[i].high:
-                    is_swing_high = False
-                    break
-
-            if is_swing_high:
-                swing_highs.append((i, candles[i].high))
-
-        return swing_highs[-5:]  # Last 5 swing highs
-
-    def _find_swing_lows(self, candles: List[Candle], lookback: int) -> List[Tuple[int, float]]:
-        """Find swing low points (index, price)."""
         swing_lows = []
 
         for i in range(lookback, len(candles) - lookback):
+            high_i = candles[i].high
+            low_i = candles[i].low
+            is_swing_high = True
             is_swing_low = True
             for j in range(i - lookback, i + lookback + 1):
-                if j != i and candles[j].low <= candles[i].low:
+                if j == i:
+                    continue
+                candle = candles[j]
+                if is_swing_high and candle.high >= high_i:
+                    is_swing_high = False
+                if is_swing_low and candle.low <= low_i:
                     is_swing_low = False
+                if not (is_swing_high or is_swing_low):
                     break
 
+            if is_swing_high:
+                swing_highs.append((i, high_i))
             if is_swing_low:
-                swing_lows.append((i, candles[i].low))
+                swing_lows.append((i, low_i))
 
-        return swing_lows[-5:]  # Last 5 swing lows
+        return swing_highs[-5:], swing_lows[-5:]  # Last 5 of each
 
     def _calculate_trendline(
         self,
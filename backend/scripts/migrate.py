@@ -12,6 +12,7 @@ Usage:
 import asyncio
 import sys
 import os
+from functools import lru_cache
 from datetime import datetime, timezone
 
 # Add backend to path for imports
@@ -33,6 +34,18 @@ def get_database_url() -> str:
     )
 
 
+@lru_cache(maxsize=1)
+def _alembic_cfg() -> Config:
+    """Load alembic.ini once per process."""
+    return Config("alembic.ini")
+
+
+@lru_cache(maxsize=1)
+def _script_dir() -> ScriptDirectory:
+    """Scan the migration versions directory once per process."""
+    return ScriptDirectory.from_config(_alembic_cfg())
+
+
 def get_environment() -> str:
     """Get current environment."""
     return os.getenv("ENVIRONMENT", os.getenv("APP_ENV", "development"))
@@ -86,7 +99,9 @@ async def create_backup(backup_name: str) -> bool:
         port = host_port[1] if len(host_port) > 1 else "5432"
         dbname = host_port_db[1].split("?")[0]  # Remove query params
 
-        backup_file = f"/tmp/{backup_name}.sql"
+        # Custom format is compressed and much smaller/faster than plain SQL.
+        # Restore with: pg_restore -h HOST -p PORT -U USER -d DBNAME --clean <file>
+        backup_file = f"/tmp/{backup_name}.dump"
 
         result = subprocess.run(
             [
@@ -94,7 +109,8 @@ async def create_backup(backup_name: str) -> bool:
                 f"-h", host,
                 f"-p", port,
                 f"-U", user,
-                "-F", "p",
+                "-F", "c",
+                "-Z", "6",
                 f"-f", backup_file,
                 dbname,
             ],
@@ -137,8 +153,7 @@ def get_current_revision() -> str | None:
 def get_head_revision() -> str | None:
     """Get head revision from migration scripts."""
     try:
-        alembic_cfg = Config("alembic.ini")
-        script = ScriptDirectory.from_config(alembic_cfg)
+        script = _script_dir()
         return script.get_current_head()
     except Exception:
         return None
@@ -155,7 +170,7 @@ def check_migration_status() -> tuple[str | None, str | None, bool]:
 def run_migrations() -> bool:
     """Run Alembic migrations."""
     try:
-        alembic_cfg = Config("alembic.ini")
+        alembic_cfg = _alembic_cfg()
         command.upgrade(alembic_cfg, "head")
         print("✓ Migrations completed successfully")
         return True
@@ -252,13 +267,13 @@ async def main():
     print("\nRunning migrations...")
     if not run_migrations():
         print("\nMigration failed!")
-        print(f"If needed, restore from backup: {backup_name}")
+        print(f"If needed, restore from backup with pg_restore: /tmp/{backup_name}.dump")
         sys.exit(1)
 
     # Step 5: Verify migration
     if not await verify_migration():
         print("\nMigration verification failed!")
-        print(f"If needed, restore from backup: {backup_name}")
+        print(f"If needed, restore from backup with pg_restore: /tmp/{backup_name}.dump")
         sys.exit(1)
 
     print("\n" + "=" * 60)
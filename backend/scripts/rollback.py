@@ -12,6 +12,7 @@ Usage:
 
 import sys
 import os
+from functools import lru_cache
 
 # Add backend to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -31,6 +32,18 @@ def get_database_url() -> str:
     )
 
 
+@lru_cache(maxsize=1)
+def _alembic_cfg() -> Config:
+    """Load alembic.ini once per process."""
+    return Config("alembic.ini")
+
+
+@lru_cache(maxsize=1)
+def _script_dir() -> ScriptDirectory:
+    """Scan the migration versions directory once per process."""
+    return ScriptDirectory.from_config(_alembic_cfg())
+
+
 def get_current_revision() -> str | None:
     """Get current database revision."""
     database_url = get_database_url()
@@ -48,8 +61,7 @@ def get_current_revision() -> str | None:
 def list_revisions() -> list[str]:
     """List all available revisions."""
     try:
-        alembic_cfg = Config("alembic.ini")
-        script = ScriptDirectory.from_config(alembic_cfg)
+        script = _script_dir()
         revisions = []
         for rev in script.walk_revisions():
             revisions.append(f"{rev.revision}: {rev.doc or 'No description'}")
@@ -66,7 +78,7 @@ def rollback_migration(target: str = "-1") -> bool:
         target: "-1" for one step, "-N" for N steps, "base" for all, or revision ID
     """
     try:
-        alembic_cfg = Config("alembic.ini")
+        alembic_cfg = _alembic_cfg()
         
         current = get_current_revision()
         print(f"Current revision: {current}")
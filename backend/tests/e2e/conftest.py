@@ -12,18 +12,17 @@ Otherwise, tests use ASGI transport with in-memory database (standalone mode).
 """
 import pytest
 import pytest_asyncio
+import httpx
 from httpx import AsyncClient, ASGITransport
-from unittest.mock import AsyncMock, patch
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
 import os
 import uuid
 
 from app.main import app
 from app.database import get_db
-from app.models.base import Base
 from app.models.user import User
 from app.auth.password import hash_password
-from app.core.rate_limiter import limiter
 
 # E2E test settings
 # If E2E_API_URL is not set, we'll use ASGI transport (standalone mode)
@@ -31,60 +30,69 @@ E2E_API_URL = os.getenv("E2E_API_URL")  # None means standalone
 E2E_FRONTEND_URL = os.getenv("E2E_FRONTEND_URL", "http://localhost:3000")
 USE_REAL_SERVER = E2E_API_URL is not None
 
+E2E_TEST_PASSWORD = "TestPassword123!"
+
 
 @pytest_asyncio.fixture
-async def e2e_db():
-    """Create an isolated in-memory database for E2E tests in standalone mode."""
+async def e2e_db(test_db):
+    """
+    Isolated database session for E2E tests in standalone mode.
+
+    Shares the session-wide test engine; per-test changes are rolled back.
+    """
     if USE_REAL_SERVER:
         yield None
         return
-    
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    async with maker() as session:
-        yield session
-    await engine.dispose()
 
+    yield test_db
 
-@pytest_asyncio.fixture
-async def e2e_client(e2e_db):
-    """HTTP client for E2E API testing.
+
+def _new_client(**kwargs) -> AsyncClient:
+    """Build an HTTP client for the configured target (real server or ASGI app)."""
+    if USE_REAL_SERVER:
+        return AsyncClient(
+            base_url=E2E_API_URL,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30),
+            **kwargs
+        )
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test", **kwargs)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def e2e_client():
+    """HTTP client for E2E API testing, shared by the whole session.
     
     Uses real HTTP when E2E_API_URL is set, otherwise uses ASGI transport.
     """
-    if USE_REAL_SERVER:
-        async with AsyncClient(base_url=E2E_API_URL, timeout=30.0) as client:
-            yield client
-    else:
-        # Use ASGI transport for standalone testing
+    async with _new_client() as client:
+        yield client
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def e2e_db_override(e2e_db, e2e_client: AsyncClient):
+    """Point the ASGI app at this test's database and drop cookies afterwards."""
+    if not USE_REAL_SERVER:
         async def override_get_db():
             yield e2e_db
 
         app.dependency_overrides[get_db] = override_get_db
-        limiter.reset()
-        
-        with patch('app.auth.blacklist.redis_client') as mock_redis:
-            mock_redis.get = AsyncMock(return_value=None)
-            mock_redis.setex = AsyncMock(return_value=True)
-            
-            transport = ASGITransport(app=app)
-            async with AsyncClient(transport=transport, base_url="http://test") as client:
-                yield client
+    yield
+    e2e_client.cookies.clear()
+    if not USE_REAL_SERVER:
         app.dependency_overrides.clear()
 
 
-@pytest_asyncio.fixture
-async def authenticated_client(e2e_client: AsyncClient, e2e_db):
+@pytest_asyncio.fixture(scope="session")
+async def e2e_access_token(test_engine, e2e_client: AsyncClient):
     """
-    Authenticated HTTP client with valid tokens.
+    Access token for one E2E test user, created once per session.
     
-    In standalone mode: Creates a test user directly in DB, then gets token.
+    In standalone mode: Creates the user directly in the shared test DB
+    (committed, so every test's rollback keeps it), then logs in.
     In real server mode: Registers user via API, then logs in.
     """
     test_email = f"e2e_test_{uuid.uuid4().hex[:8]}@test.com"
-    test_password = "TestPassword123!"
     
     if USE_REAL_SERVER:
         # Real server mode: Register via API
@@ -92,7 +100,7 @@ async def authenticated_client(e2e_client: AsyncClient, e2e_db):
             "/api/v1/auth/register",
             json={
                 "email": test_email,
-                "password": test_password,
+                "password": E2E_TEST_PASSWORD,
                 "full_name": "E2E Test User"
             }
         )
@@ -105,65 +113,69 @@ async def authenticated_client(e2e_client: AsyncClient, e2e_db):
             "/api/v1/auth/login",
             json={
                 "email": test_email,
-                "password": test_password
+                "password": E2E_TEST_PASSWORD
             }
         )
+        e2e_client.cookies.clear()
         
         if login_response.status_code != 200:
             pytest.skip(f"Could not login test user: {login_response.text}")
         
-        tokens = login_response.json()
-        access_token = tokens["access_token"]
-        
-        async with AsyncClient(
-            base_url=E2E_API_URL,
-            timeout=30.0,
-            headers={"Authorization": f"Bearer {access_token}"}
-        ) as auth_client:
-            yield auth_client
-    else:
-        # Standalone mode: Create user directly in DB
-        user = User(
+        yield login_response.json()["access_token"]
+        return
+
+    # Standalone mode: Create user directly in DB
+    async with AsyncSession(test_engine, expire_on_commit=False) as session:
+        session.add(User(
             email=test_email,
             full_name="E2E Test User",
-            hashed_password=hash_password(test_password),
+            hashed_password=hash_password(E2E_TEST_PASSWORD),
             is_active=True
-        )
-        e2e_db.add(user)
-        await e2e_db.commit()
-        await e2e_db.refresh(user)
+        ))
+        await session.commit()
         
         # Login to get token via ASGI transport
+        async def override_get_db():
+            yield session
+
+        app.dependency_overrides[get_db] = override_get_db
         login_response = await e2e_client.post(
             "/api/v1/auth/login",
-            json={"email": test_email, "password": test_password}
+            json={"email": test_email, "password": E2E_TEST_PASSWORD}
         )
-        
+        e2e_client.cookies.clear()
+        app.dependency_overrides.clear()
+    
+    try:
         if login_response.status_code != 200:
             pytest.skip(f"Could not login test user: {login_response.text}")
         
-        tokens = login_response.json()
-        access_token = tokens["access_token"]
-        
-        # Create authenticated client using same ASGI transport
-        async def override_get_db():
-            yield e2e_db
+        yield login_response.json()["access_token"]
+    finally:
+        async with AsyncSession(test_engine) as session:
+            await session.execute(delete(User).where(User.email == test_email))
+            await session.commit()
 
-        app.dependency_overrides[get_db] = override_get_db
-        limiter.reset()
-        
-        with patch('app.auth.blacklist.redis_client') as mock_redis:
-            mock_redis.get = AsyncMock(return_value=None)
-            mock_redis.setex = AsyncMock(return_value=True)
-            
-            transport = ASGITransport(app=app)
-            async with AsyncClient(
-                transport=transport, 
-                base_url="http://test",
-                headers={"Authorization": f"Bearer {access_token}"}
-            ) as auth_client:
-                yield auth_client
-        app.dependency_overrides.clear()
+
+@pytest_asyncio.fixture(scope="session")
+async def authenticated_client(e2e_access_token: str):
+    """
+    Authenticated HTTP client with valid tokens, shared by the whole session.
+    
+    Uses the same target and per-test DB override as e2e_client.
+    """
+    async with _new_client(
+        headers={"Authorization": f"Bearer {e2e_access_token}"}
+    ) as auth_client:
+        yield auth_client
+
+
+@pytest_asyncio.fixture(scope="session")
+async def openapi_schema(e2e_client: AsyncClient):
+    """Parsed /openapi.json, fetched once per session."""
+    response = await e2e_client.get("/openapi.json")
+    response.raise_for_status()
+    return response.json()
 
 
 @pytest.fixture
@@ -10,12 +10,33 @@ Tests:
 - /health/detailed - Detailed metrics
 """
 
+import asyncio
 import pytest
-from unittest.mock import patch, AsyncMock, MagicMock
-from httpx import AsyncClient, ASGITransport
+from unittest.mock import patch, AsyncMock
 from datetime import datetime, timezone
 
 
+@pytest.fixture(scope="module", autouse=True)
+def mock_redis():
+    """Patch redis.asyncio.from_url once for the module with a healthy client."""
+    with patch("redis.asyncio.from_url") as mock_from_url:
+        mock_client = AsyncMock()
+        mock_client.ping = AsyncMock(return_value=True)
+        mock_client.info = AsyncMock(return_value={"used_memory": 0})
+        mock_client.close = AsyncMock()
+        mock_from_url.return_value = mock_client
+        yield mock_client
+
+
+@pytest.fixture(autouse=True)
+def reset_mock_redis(mock_redis):
+    """Undo per-test failure/metric tweaks on the shared Redis mock."""
+    yield
+    mock_redis.ping.side_effect = None
+    mock_redis.info.side_effect = None
+    mock_redis.info.return_value = {"used_memory": 0}
+
+
 class TestBasicHealthEndpoint:
     """Tests for /health endpoint."""
 
@@ -46,8 +67,8 @@ class TestBasicHealthEndpoint:
         response = await client.get("/health")
         
         data = response.json()
-        # Should be parseable as ISO format
-        timestamp = datetime.fromisoformat(data["timestamp"].replace("Z", "+00:00"))
+        # Should be parseable as ISO format (fromisoformat accepts a trailing Z on 3.11+)
+        timestamp = datetime.fromisoformat(data["timestamp"])
         assert timestamp is not None
 
 
@@ -67,10 +88,9 @@ class TestLivenessEndpoint:
     @pytest.mark.asyncio
     async def test_liveness_always_returns_200(self, client):
         """Liveness check always returns 200 if process is running."""
-        # Call multiple times - should always be 200
-        for _ in range(3):
-            response = await client.get("/health/live")
-            assert response.status_code == 200
+        # Call multiple times concurrently - should always be 200
+        responses = await asyncio.gather(*(client.get("/health/live") for _ in range(3)))
+        assert all(r.status_code == 200 for r in responses)
 
 
 class TestReadinessEndpoint:
@@ -79,131 +99,99 @@ class TestReadinessEndpoint:
     @pytest.mark.asyncio
     async def test_readiness_returns_ready_when_all_healthy(self, client, test_db):
         """Readiness returns ready when all dependencies healthy."""
-        # Mock Redis to be healthy - patch at redis.asyncio module level
-        with patch("redis.asyncio.from_url") as mock_from_url:
-            mock_client = AsyncMock()
-            mock_client.ping = AsyncMock(return_value=True)
-            mock_client.close = AsyncMock()
-            mock_from_url.return_value = mock_client
-            
-            response = await client.get("/health/ready")
-            
-            # Since we're in test mode with SQLite, DB should pass
-            # Redis is mocked to pass
-            data = response.json()
-            
-            # If database check fails (common in isolated tests), that's expected
-            # Main test is that the endpoint works and returns proper structure
-            assert response.status_code in [200, 503]
-            assert "status" in data
-            assert "checks" in data
-            assert "database" in data["checks"]
-            assert "redis" in data["checks"]
-            
-            # If all healthy, should be ready
-            if data["checks"]["database"] and data["checks"]["redis"]:
-                assert data["status"] == "ready"
-                assert response.status_code == 200
+        # Redis is healthy via the module-level mock_redis fixture
+        response = await client.get("/health/ready")
+        
+        # Since we're in test mode with SQLite, DB should pass
+        # Redis is mocked to pass
+        data = response.json()
+        
+        # If database check fails (common in isolated tests), that's expected
+        # Main test is that the endpoint works and returns proper structure
+        assert response.status_code in [200, 503]
+        assert "status" in data
+        assert "checks" in data
+        assert "database" in data["checks"]
+        assert "redis" in data["checks"]
+        
+        # If all healthy, should be ready
+        if data["checks"]["database"] and data["checks"]["redis"]:
+            assert data["status"] == "ready"
+            assert response.status_code == 200
 
     @pytest.mark.asyncio
-    async def test_readiness_returns_503_when_redis_unhealthy(self, client, test_db):
+    async def test_readiness_returns_503_when_redis_unhealthy(self, client, test_db, mock_redis):
         """Readiness returns 503 when Redis is unavailable."""
-        with patch("redis.asyncio.from_url") as mock_redis:
-            mock_client = AsyncMock()
-            mock_client.ping = AsyncMock(side_effect=ConnectionError("Redis unavailable"))
-            mock_redis.return_value = mock_client
-            
-            response = await client.get("/health/ready")
-            
-            assert response.status_code == 503
-            data = response.json()
-            assert data["status"] == "not_ready"
-            assert data["checks"]["redis"] is False
-            assert "errors" in data
-            assert "redis" in data["errors"]
+        mock_redis.ping.side_effect = ConnectionError("Redis unavailable")
+
+        response = await client.get("/health/ready")
+        
+        assert response.status_code == 503
+        data = response.json()
+        assert data["status"] == "not_ready"
+        assert data["checks"]["redis"] is False
+        assert "errors" in data
+        assert "redis" in data["errors"]
 
     @pytest.mark.asyncio
-    async def test_readiness_includes_error_details(self, client, test_db):
+    async def test_readiness_includes_error_details(self, client, test_db, mock_redis):
         """Readiness includes error details when dependency fails."""
-        with patch("redis.asyncio.from_url") as mock_redis:
-            mock_client = AsyncMock()
-            mock_client.ping = AsyncMock(side_effect=ConnectionError("Connection refused"))
-            mock_redis.return_value = mock_client
-            
-            response = await client.get("/health/ready")
-            
-            data = response.json()
-            assert "errors" in data
-            assert "Connection refused" in data["errors"]["redis"]
+        mock_redis.ping.side_effect = ConnectionError("Connection refused")
+
+        response = await client.get("/health/ready")
+        
+        data = response.json()
+        assert "errors" in data
+        assert "Connection refused" in data["errors"]["redis"]
 
 
 class TestDetailedHealthEndpoint:
     """Tests for /health/detailed endpoint."""
 
     @pytest.mark.asyncio
-    async def test_detailed_includes_system_metrics(self, client, test_db):
+    async def test_detailed_includes_system_metrics(self, client, test_db, mock_redis):
         """Detailed health includes system metrics."""
-        with patch("redis.asyncio.from_url") as mock_redis:
-            mock_client = AsyncMock()
-            mock_client.ping = AsyncMock(return_value=True)
-            mock_client.info = AsyncMock(return_value={"used_memory": 1024 * 1024 * 50})  # 50MB
-            mock_client.close = AsyncMock()
-            mock_redis.return_value = mock_client
-            
-            response = await client.get("/health/detailed")
-            
-            # Response should work regardless of DB state
-            data = response.json()
-            assert "system" in data
-            assert "cpu_percent" in data["system"]
-            assert "memory_percent" in data["system"]
-            assert "disk_percent" in data["system"]
+        mock_redis.info.return_value = {"used_memory": 1024 * 1024 * 50}  # 50MB
+
+        response = await client.get("/health/detailed")
+        
+        # Response should work regardless of DB state
+        data = response.json()
+        assert "system" in data
+        assert "cpu_percent" in data["system"]
+        assert "memory_percent" in data["system"]
+        assert "disk_percent" in data["system"]
 
     @pytest.mark.asyncio
-    async def test_detailed_includes_redis_memory(self, client, test_db):
+    async def test_detailed_includes_redis_memory(self, client, test_db, mock_redis):
         """Detailed health includes Redis memory usage."""
-        with patch("redis.asyncio.from_url") as mock_redis:
-            mock_client = AsyncMock()
-            mock_client.ping = AsyncMock(return_value=True)
-            mock_client.info = AsyncMock(return_value={"used_memory": 1024 * 1024 * 100})  # 100MB
-            mock_client.close = AsyncMock()
-            mock_redis.return_value = mock_client
-            
-            response = await client.get("/health/detailed")
-            
-            data = response.json()
-            assert data["checks"]["redis_memory_mb"] == 100.0
+        mock_redis.info.return_value = {"used_memory": 1024 * 1024 * 100}  # 100MB
+
+        response = await client.get("/health/detailed")
+        
+        data = response.json()
+        assert data["checks"]["redis_memory_mb"] == 100.0
 
     @pytest.mark.asyncio
-    async def test_detailed_returns_503_when_unhealthy(self, client, test_db):
+    async def test_detailed_returns_503_when_unhealthy(self, client, test_db, mock_redis):
         """Detailed health returns 503 when dependencies fail."""
-        with patch("redis.asyncio.from_url") as mock_redis:
-            mock_client = AsyncMock()
-            mock_client.ping = AsyncMock(side_effect=ConnectionError("Redis down"))
-            mock_redis.return_value = mock_client
-            
-            response = await client.get("/health/detailed")
-            
-            assert response.status_code == 503
-            data = response.json()
-            assert data["status"] == "unhealthy"
+        mock_redis.info.side_effect = ConnectionError("Redis down")
+
+        response = await client.get("/health/detailed")
+        
+        assert response.status_code == 503
+        data = response.json()
+        assert data["status"] == "unhealthy"
 
     @pytest.mark.asyncio
     async def test_detailed_includes_version_and_environment(self, client, test_db):
         """Detailed health includes version and environment info."""
-        with patch("redis.asyncio.from_url") as mock_redis:
-            mock_client = AsyncMock()
-            mock_client.ping = AsyncMock(return_value=True)
-            mock_client.info = AsyncMock(return_value={"used_memory": 0})
-            mock_client.close = AsyncMock()
-            mock_redis.return_value = mock_client
-            
-            response = await client.get("/health/detailed")
-            
-            data = response.json()
-            assert "version" in data
-            assert "environment" in data
-            assert "timestamp" in data
+        response = await client.get("/health/detailed")
+        
+        data = response.json()
+        assert "version" in data
+        assert "environment" in data
+        assert "timestamp" in data
 
 
 class TestHealthEndpointIntegration:
@@ -214,17 +202,9 @@ class TestHealthEndpointIntegration:
         """All health endpoints are accessible without auth."""
         endpoints = ["/health", "/health/live", "/health/ready", "/health/detailed"]
         
-        for endpoint in endpoints:
-            with patch("redis.asyncio.from_url") as mock_redis:
-                mock_client = AsyncMock()
-                mock_client.ping = AsyncMock(return_value=True)
-                mock_client.info = AsyncMock(return_value={"used_memory": 0})
-                mock_client.close = AsyncMock()
-                mock_redis.return_value = mock_client
-                
-                response = await client.get(endpoint)
-                # Should not return 401/403
-                assert response.status_code in [200, 503]
+        responses = await asyncio.gather(*(client.get(e) for e in endpoints))
+        # Should not return 401/403
+        assert all(r.status_code in (200, 503) for r in responses)
 
     @pytest.mark.asyncio
     async def test_health_endpoints_no_authentication_required(self, client):
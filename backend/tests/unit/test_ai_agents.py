@@ -1,9 +1,90 @@
 import pytest
-from app.ai_agents.risk_agent import RiskAgent, HARD_CAPS
+import pytest_asyncio
+from sqlalchemy import String, cast, insert, literal, select
+from app.ai_agents.risk_agent import RiskAgent, RejectReason, HARD_CAPS
 from app.models.ai_agent import SystemMode
 from app.models.signal import Signal, SignalType, SignalStatus
 from app.models.position import Position, PositionStatus, PositionSide
 from datetime import datetime, timedelta
+from types import MappingProxyType
+
+
+EXPECTED_HARD_CAPS = {
+    "max_risk_per_trade": 2.0,
+    "max_daily_loss": 5.0,
+    "max_trades_per_day": 20,
+    "max_open_positions": 10,
+    "max_order_size": 1.0,
+    "emergency_drawdown_stop": 15.0,
+}
+
+_BASE_SIGNAL_KWARGS = MappingProxyType({
+    "strategy_name": "NBB",
+    "symbol": "EURUSD",
+    "signal_type": SignalType.LONG,
+    "status": SignalStatus.PENDING,
+    "entry_price": 1.1000,
+    "stop_loss": 1.0950,
+    "take_profit": 1.1150,
+    "risk_percent": 2.0,
+    "timeframe": "1h",
+    "confidence": 75.0,
+})
+
+
+def make_signal(**overrides) -> Signal:
+    """Build the standard NBB EURUSD long signal, with any field overridden."""
+    return Signal(signal_time=datetime.utcnow(), **{**_BASE_SIGNAL_KWARGS, **overrides})
+
+
+@pytest_asyncio.fixture
+async def risk_agent_autonomous(test_db):
+    """RiskAgent in AUTONOMOUS mode bound to this test's rolled-back session."""
+    return RiskAgent(db=test_db, system_mode=SystemMode.AUTONOMOUS)
+
+
+def _position_rows(n_positions: int, **columns):
+    """SELECT producing n_positions rows of the given Position column values, generated in SQL."""
+    cnt = select(literal(0).label("i")).cte("cnt", recursive=True)
+    cnt = cnt.union_all(select(cnt.c.i + 1).where(cnt.c.i < n_positions - 1))
+    table = Position.__table__
+    return select(
+        (literal("Strategy") + cast(cnt.c.i, String)).label("strategy_name"),
+        *(literal(value, table.c[name].type).label(name) for name, value in columns.items())
+    )
+
+
+@pytest_asyncio.fixture
+async def seeded_positions(request, test_db, test_user):
+    """Seed (n_positions, status) positions: OPEN ones now, CLOSED ones earlier today."""
+    n_positions, status = getattr(request, "param", (0, PositionStatus.OPEN))
+    if n_positions:
+        now = datetime.utcnow()
+        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        closed = status == PositionStatus.CLOSED
+        columns = dict(
+            user_id=test_user.id,
+            symbol="EURUSD",
+            side=PositionSide.LONG,
+            status=status,
+            entry_price=1.1000,
+            position_size=0.1,
+            entry_time=today_start if closed else now,
+            stop_loss=1.0950,
+            take_profit=1.1150,
+            exit_price=1.1050 if closed else None,
+            exit_time=today_start + timedelta(minutes=5) if closed else None,
+            unrealized_pnl=0.0,
+            realized_pnl=5.0 if closed else None
+        )
+        # One INSERT ... SELECT over a recursive CTE: rows are generated in the DB
+        await test_db.execute(
+            insert(Position).from_select(
+                ["strategy_name", *columns], _position_rows(n_positions, **columns)
+            )
+        )
+        await test_db.commit()
+    return n_positions
 
 
 @pytest.mark.asyncio
@@ -12,12 +93,7 @@ class TestRiskAgent:
 
     async def test_hard_caps_defined(self):
         """Test that all hard caps are properly defined."""
-        assert HARD_CAPS["max_risk_per_trade"] == 2.0
-        assert HARD_CAPS["max_daily_loss"] == 5.0
-        assert HARD_CAPS["max_trades_per_day"] == 20
-        assert HARD_CAPS["max_open_positions"] == 10
-        assert HARD_CAPS["max_order_size"] == 1.0
-        assert HARD_CAPS["emergency_drawdown_stop"] == 15.0
+        assert {k: HARD_CAPS[k] for k in EXPECTED_HARD_CAPS} == EXPECTED_HARD_CAPS
 
     async def test_position_size_calculation(self, test_db):
         """Test position size calculation logic."""
@@ -46,166 +122,55 @@ class TestRiskAgent:
         )
         assert position_size_zero == 0.0
 
-    async def test_validate_signal_approved(self, test_db, test_user):
-        """Test signal validation when all checks pass."""
-        agent = RiskAgent(db=test_db, system_mode=SystemMode.AUTONOMOUS)
-
-        signal = Signal(
-            user_id=test_user.id,
-            strategy_name="NBB",
-            symbol="EURUSD",
-            signal_type=SignalType.LONG,
-            status=SignalStatus.PENDING,
-            entry_price=1.1000,
-            stop_loss=1.0950,
-            take_profit=1.1150,
-            risk_percent=2.0,
-            timeframe="1h",
-            confidence=75.0,
-            signal_time=datetime.utcnow()
-        )
-
-        validation = await agent.validate_signal(signal, account_balance=10000.0)
-
-        assert validation["approved"] is True
-        assert validation["position_size"] > 0
-        assert validation["reason"] == "All risk checks passed"
-
-    async def test_validate_signal_max_open_positions(self, test_db, test_user):
-        """Test signal rejection when max open positions reached."""
-        agent = RiskAgent(db=test_db, system_mode=SystemMode.AUTONOMOUS)
-
-        # Create 10 open positions (at limit)
-        for i in range(10):
-            position = Position(
-                user_id=test_user.id,
-                strategy_name=f"Strategy{i}",
-                symbol="EURUSD",
-                side=PositionSide.LONG,
-                status=PositionStatus.OPEN,
-                entry_price=1.1000,
-                position_size=0.1,
-                entry_time=datetime.utcnow(),
-                stop_loss=1.0950,
-                take_profit=1.1150,
-                unrealized_pnl=0.0
-            )
-            test_db.add(position)
-
-        await test_db.commit()
-
-        signal = Signal(
-            user_id=test_user.id,
-            strategy_name="NBB",
-            symbol="EURUSD",
-            signal_type=SignalType.LONG,
-            status=SignalStatus.PENDING,
-            entry_price=1.1000,
-            stop_loss=1.0950,
-            take_profit=1.1150,
-            risk_percent=2.0,
-            timeframe="1h",
-            confidence=75.0,
-            signal_time=datetime.utcnow()
-        )
-
-        validation = await agent.validate_signal(signal, account_balance=10000.0)
-
-        assert validation["approved"] is False
-        assert "Max open positions reached" in validation["reason"]
-
-    async def test_validate_signal_daily_trade_limit(self, test_db, test_user):
-        """Test signal rejection when daily trade limit reached."""
-        agent = RiskAgent(db=test_db, system_mode=SystemMode.AUTONOMOUS)
-
-        # Create 20 positions today (at limit)
-        today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-
-        for i in range(20):
-            position = Position(
-                user_id=test_user.id,
-                strategy_name=f"Strategy{i}",
-                symbol="EURUSD",
-                side=PositionSide.LONG,
-                status=PositionStatus.CLOSED,
-                entry_price=1.1000,
-                position_size=0.1,
-                entry_time=today_start + timedelta(minutes=i*10),
-                stop_loss=1.0950,
-                take_profit=1.1150,
-                exit_price=1.1050,
-                exit_time=today_start + timedelta(minutes=i*10+5),
-                unrealized_pnl=0.0,
-                realized_pnl=5.0
-            )
-            test_db.add(position)
-
-        await test_db.commit()
-
-        signal = Signal(
-            user_id=test_user.id,
-            strategy_name="NBB",
-            symbol="EURUSD",
-            signal_type=SignalType.LONG,
-            status=SignalStatus.PENDING,
-            entry_price=1.1000,
-            stop_loss=1.0950,
-            take_profit=1.1150,
-            risk_percent=2.0,
-            timeframe="1h",
-            confidence=75.0,
-            signal_time=datetime.utcnow()
-        )
-
-        validation = await agent.validate_signal(signal, account_balance=10000.0)
-
-        assert validation["approved"] is False
-        assert "Daily trade limit reached" in validation["reason"]
-
-    async def test_validate_signal_low_risk_reward(self, test_db, test_user):
-        """Test signal rejection when R:R ratio is too low."""
-        agent = RiskAgent(db=test_db, system_mode=SystemMode.AUTONOMOUS)
-
-        signal = Signal(
-            user_id=test_user.id,
-            strategy_name="NBB",
-            symbol="EURUSD",
-            signal_type=SignalType.LONG,
-            status=SignalStatus.PENDING,
-            entry_price=1.1000,
-            stop_loss=1.0950,  # Risk: 50 pips
-            take_profit=1.1040,  # Reward: 40 pips (R:R = 0.8)
-            risk_percent=2.0,
-            timeframe="1h",
-            confidence=75.0,
-            signal_time=datetime.utcnow()
-        )
-
-        validation = await agent.validate_signal(signal, account_balance=10000.0)
-
-        assert validation["approved"] is False
-        assert "R:R ratio too low" in validation["reason"]
-
-    async def test_check_emergency_conditions_normal(self, test_db):
-        """Test emergency check under normal conditions."""
-        agent = RiskAgent(db=test_db, system_mode=SystemMode.AUTONOMOUS)
-
-        emergency = await agent.check_emergency_conditions(
-            account_balance=9500.0,
-            peak_balance=10000.0
-        )
-
-        # 5% drawdown - within acceptable range
-        assert emergency is False
-
-    async def test_check_emergency_conditions_triggered(self, test_db):
-        """Test emergency shutdown when drawdown exceeds limit."""
-        agent = RiskAgent(db=test_db, system_mode=SystemMode.AUTONOMOUS)
-
-        emergency = await agent.check_emergency_conditions(
-            account_balance=8400.0,  # 16% drawdown
+    @pytest.mark.parametrize(
+        "seeded_positions, override, expected_reason_code",
+        [
+            # All checks pass
+            ((0, PositionStatus.OPEN), {}, None),
+            # Risk: 50 pips, Reward: 40 pips (R:R = 0.8)
+            ((0, PositionStatus.OPEN), {"take_profit": 1.1040}, RejectReason.LOW_RISK_REWARD),
+            # 10 open positions (at limit)
+            ((10, PositionStatus.OPEN), {}, RejectReason.MAX_OPEN_POSITIONS),
+            # 20 positions today (at limit)
+            ((20, PositionStatus.CLOSED), {}, RejectReason.DAILY_TRADE_LIMIT),
+        ],
+        indirect=["seeded_positions"],
+        ids=["approved", "low_risk_reward", "max_open_positions", "daily_trade_limit"],
+    )
+    async def test_validate_signal(
+        self,
+        risk_agent_autonomous,
+        test_user,
+        seeded_positions,
+        override,
+        expected_reason_code,
+    ):
+        """Test signal validation outcomes across the risk checks."""
+        signal = make_signal(user_id=test_user.id, **override)
+
+        validation = await risk_agent_autonomous.validate_signal(signal, account_balance=10000.0)
+
+        assert validation["reason_code"] == expected_reason_code
+        assert validation["approved"] is (expected_reason_code is None)
+        if expected_reason_code is None:
+            assert validation["position_size"] > 0
+            assert validation["reason"] == "All risk checks passed"
+
+    @pytest.mark.parametrize(
+        "account_balance, expected_emergency",
+        [
+            (9500.0, False),  # 5% drawdown - within acceptable range
+            (8400.0, True),  # 16% drawdown - exceeds 15% emergency threshold
+        ],
+        ids=["normal", "triggered"],
+    )
+    async def test_check_emergency_conditions(
+        self, risk_agent_autonomous, account_balance, expected_emergency
+    ):
+        """Test emergency shutdown triggers only past the drawdown limit."""
+        emergency = await risk_agent_autonomous.check_emergency_conditions(
+            account_balance=account_balance,
             peak_balance=10000.0
         )
 
-        # 16% drawdown - exceeds 15% emergency threshold
-        assert emergency is True
+        assert emergency is expected_emergency
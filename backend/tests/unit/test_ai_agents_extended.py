@@ -1,4 +1,6 @@
 import pytest
+import pytest_asyncio
+from unittest.mock import MagicMock
 from app.ai_agents.supervisor_agent import SupervisorAgent, HARD_CAPS
 from app.ai_agents.strategy_agent import StrategyAgent
 from app.ai_agents.execution_agent import ExecutionAgent
@@ -8,6 +10,42 @@ from app.models.position import Position, PositionStatus, PositionSide
 from app.models.optimization import Playbook
 from app.models.backtest import BacktestResult
 from datetime import datetime
+from types import MappingProxyType
+
+
+SIGNAL_TIME = datetime(2024, 1, 1, 12, 0, 0)
+
+_BASE_BACKTEST_KWARGS = MappingProxyType({
+    "strategy_name": "NBB",
+    "symbol": "EURUSD",
+    "timeframe": "1h",
+    "user_id": 1,
+    "start_date": datetime(2024, 1, 1),
+    "end_date": datetime(2024, 3, 1),
+    "initial_capital": 10000.0,
+    "total_trades": 50,
+    "winning_trades": 30,
+    "losing_trades": 20,
+    "win_rate": 60.0,
+    "total_return": 0.15,
+    "sharpe_ratio": 1.2,
+    "max_drawdown": 8.0,
+})
+
+
+def make_backtest(**overrides) -> BacktestResult:
+    """Build a passing NBB EURUSD backtest result, with any field overridden."""
+    # equity_curve/trade_log are left to the column default; the params
+    # dict is built per call so no two rows share a mutable value
+    return BacktestResult(
+        **{**_BASE_BACKTEST_KWARGS, "strategy_params": {"threshold": 0.8}, **overrides}
+    )
+
+
+@pytest_asyncio.fixture
+async def supervisor_autonomous(test_db):
+    """SupervisorAgent in AUTONOMOUS mode bound to this test's rolled-back session."""
+    return SupervisorAgent(db=test_db, system_mode=SystemMode.AUTONOMOUS)
 
 
 @pytest.mark.asyncio
@@ -23,7 +61,7 @@ class TestSupervisorAgent:
             description="Test mode config"
         )
         test_db.add(config)
-        await test_db.commit()
+        await test_db.flush()
 
         agent = SupervisorAgent(db=test_db, system_mode=SystemMode.GUIDE)
         result = await agent.enforce_mode()
@@ -40,7 +78,7 @@ class TestSupervisorAgent:
             description="Test mode config"
         )
         test_db.add(config)
-        await test_db.commit()
+        await test_db.flush()
 
         agent = SupervisorAgent(db=test_db, system_mode=SystemMode.AUTONOMOUS)
         result = await agent.enforce_mode()
@@ -58,156 +96,58 @@ class TestSupervisorAgent:
         assert len(verification["violations"]) == 0
         assert verification["hard_caps"] == HARD_CAPS
 
-    async def test_can_proceed_with_trading_allowed(self, test_db):
-        """Test trading permission when all checks pass."""
-        agent = SupervisorAgent(db=test_db, system_mode=SystemMode.AUTONOMOUS)
-
-        permission = await agent.can_proceed_with_trading(
-            account_balance=9500.0,
-            peak_balance=10000.0,
-            open_positions=5,
-            trades_today=10
-        )
-
-        assert permission["can_proceed"] is True
-        assert len(permission["reasons"]) == 0
-
-    async def test_can_proceed_with_trading_blocked_positions(self, test_db):
-        """Test trading blocked when max positions reached."""
-        agent = SupervisorAgent(db=test_db, system_mode=SystemMode.AUTONOMOUS)
-
-        permission = await agent.can_proceed_with_trading(
-            account_balance=9500.0,
-            peak_balance=10000.0,
-            open_positions=10,  # At limit
-            trades_today=5
-        )
-
-        assert permission["can_proceed"] is False
-        assert any("Max open positions" in reason for reason in permission["reasons"])
-
-    async def test_can_proceed_with_trading_blocked_daily_limit(self, test_db):
-        """Test trading blocked when daily limit reached."""
-        agent = SupervisorAgent(db=test_db, system_mode=SystemMode.AUTONOMOUS)
-
-        permission = await agent.can_proceed_with_trading(
-            account_balance=9500.0,
-            peak_balance=10000.0,
-            open_positions=5,
-            trades_today=20  # At limit
+    @pytest.mark.parametrize(
+        "balance, peak, positions, trades, ok, needle",
+        [
+            (9500.0, 10000.0, 5, 10, True, None),
+            (9500.0, 10000.0, 10, 5, False, "Max open positions"),  # At limit
+            (9500.0, 10000.0, 5, 20, False, "Daily trade limit"),  # At limit
+            (8400.0, 10000.0, 5, 10, False, "Emergency drawdown"),  # 16% drawdown
+        ],
+        ids=["allowed", "blocked_positions", "blocked_daily_limit", "blocked_drawdown"],
+    )
+    async def test_can_proceed_with_trading(
+        self, supervisor_autonomous, balance, peak, positions, trades, ok, needle
+    ):
+        """Test trading permission across the supervisor's blocking checks."""
+        permission = await supervisor_autonomous.can_proceed_with_trading(
+            account_balance=balance,
+            peak_balance=peak,
+            open_positions=positions,
+            trades_today=trades
         )
 
-        assert permission["can_proceed"] is False
-        assert any("Daily trade limit" in reason for reason in permission["reasons"])
-
-    async def test_can_proceed_with_trading_blocked_drawdown(self, test_db):
-        """Test trading blocked when emergency drawdown reached."""
-        agent = SupervisorAgent(db=test_db, system_mode=SystemMode.AUTONOMOUS)
-
-        permission = await agent.can_proceed_with_trading(
-            account_balance=8400.0,  # 16% drawdown
-            peak_balance=10000.0,
-            open_positions=5,
-            trades_today=10
-        )
-
-        assert permission["can_proceed"] is False
-        assert any("Emergency drawdown" in reason for reason in permission["reasons"])
+        assert permission["can_proceed"] is ok
+        if needle is None:
+            assert len(permission["reasons"]) == 0
+        else:
+            assert any(needle in reason for reason in permission["reasons"])
 
 
 @pytest.mark.asyncio
 class TestStrategyAgent:
     """Test suite for StrategyAgent."""
 
-    async def test_evaluate_strategy_performance_pass(self, test_db):
-        """Test strategy evaluation when performance meets criteria."""
-        # Create a good backtest result
-        backtest = BacktestResult(
-            strategy_name="NBB",
-            symbol="EURUSD",
-            timeframe="1h",
-            user_id=1,
-            start_date=datetime(2024, 1, 1),
-            end_date=datetime(2024, 3, 1),
-            initial_capital=10000.0,
-            total_trades=50,
-            winning_trades=30,
-            losing_trades=20,
-            win_rate=60.0,
-            total_return=0.15,
-            sharpe_ratio=1.2,
-            max_drawdown=8.0,
-            equity_curve=[],
-            trade_log=[],
-            strategy_params={"threshold": 0.8}
-        )
-        test_db.add(backtest)
-        await test_db.commit()
-
-        agent = StrategyAgent(db=test_db, system_mode=SystemMode.GUIDE)
-        result = await agent._evaluate_strategy_performance("NBB", "EURUSD")
-
-        assert result is True
-
-    async def test_evaluate_strategy_performance_fail_low_sharpe(self, test_db):
-        """Test strategy evaluation fails with low Sharpe ratio."""
-        # Create a backtest with low Sharpe ratio
-        backtest = BacktestResult(
-            strategy_name="NBB",
-            symbol="EURUSD",
-            timeframe="1h",
-            user_id=1,
-            start_date=datetime(2024, 1, 1),
-            end_date=datetime(2024, 3, 1),
-            initial_capital=10000.0,
-            total_trades=50,
-            winning_trades=22,
-            losing_trades=28,
-            win_rate=44.0,
-            total_return=0.02,
-            sharpe_ratio=0.3,  # Too low
-            max_drawdown=12.0,
-            equity_curve=[],
-            trade_log=[],
-            strategy_params={"threshold": 0.8}
-        )
-        test_db.add(backtest)
-        await test_db.commit()
+    @pytest.mark.parametrize(
+        "sharpe_ratio, max_drawdown, expected",
+        [
+            (1.2, 8.0, True),
+            (0.3, 12.0, False),  # Sharpe too low
+            (0.8, 25.0, False),  # Drawdown too high
+        ],
+        ids=["pass", "fail_low_sharpe", "fail_high_drawdown"],
+    )
+    async def test_evaluate_strategy_performance(
+        self, test_db, sharpe_ratio, max_drawdown, expected
+    ):
+        """Test strategy evaluation against the Sharpe and drawdown criteria."""
+        test_db.add(make_backtest(sharpe_ratio=sharpe_ratio, max_drawdown=max_drawdown))
+        await test_db.flush()
 
         agent = StrategyAgent(db=test_db, system_mode=SystemMode.GUIDE)
         result = await agent._evaluate_strategy_performance("NBB", "EURUSD")
 
-        assert result is False
-
-    async def test_evaluate_strategy_performance_fail_high_drawdown(self, test_db):
-        """Test strategy evaluation fails with high drawdown."""
-        # Create a backtest with high drawdown
-        backtest = BacktestResult(
-            strategy_name="NBB",
-            symbol="EURUSD",
-            timeframe="1h",
-            user_id=1,
-            start_date=datetime(2024, 1, 1),
-            end_date=datetime(2024, 3, 1),
-            initial_capital=10000.0,
-            total_trades=50,
-            winning_trades=28,
-            losing_trades=22,
-            win_rate=56.0,
-            total_return=0.10,
-            sharpe_ratio=0.8,
-            max_drawdown=25.0,  # Too high
-            equity_curve=[],
-            trade_log=[],
-            strategy_params={"threshold": 0.8}
-        )
-        test_db.add(backtest)
-        await test_db.commit()
-
-        agent = StrategyAgent(db=test_db, system_mode=SystemMode.GUIDE)
-        result = await agent._evaluate_strategy_performance("NBB", "EURUSD")
-
-        assert result is False
+        assert result is expected
 
 
 @pytest.mark.asyncio
@@ -230,10 +170,10 @@ class TestExecutionAgent:
             risk_percent=2.0,
             timeframe="1h",
             confidence=75.0,
-            signal_time=datetime.utcnow()
+            signal_time=SIGNAL_TIME
         )
         test_db.add(signal)
-        await test_db.commit()
+        await test_db.flush()
 
         position = await agent.execute_signal(
             signal=signal,
@@ -260,10 +200,10 @@ class TestExecutionAgent:
             risk_percent=2.0,
             timeframe="1h",
             confidence=75.0,
-            signal_time=datetime.utcnow()
+            signal_time=SIGNAL_TIME
         )
         test_db.add(signal)
-        await test_db.commit()
+        await test_db.flush()
 
         position = await agent.execute_signal(
             signal=signal,
@@ -279,64 +219,42 @@ class TestExecutionAgent:
         assert position.status == PositionStatus.OPEN
         assert position.position_size == 0.5
 
-    async def test_close_position_long(self, test_db, test_user):
-        """Test closing a long position."""
-        agent = ExecutionAgent(db=test_db, system_mode=SystemMode.AUTONOMOUS)
-
-        position = Position(
-            user_id=test_user.id,
-            strategy_name="NBB",
-            symbol="EURUSD",
-            side=PositionSide.LONG,
-            status=PositionStatus.OPEN,
-            entry_price=1.1000,
-            position_size=1.0,
-            entry_time=datetime.utcnow(),
-            stop_loss=1.0950,
-            take_profit=1.1150,
-            unrealized_pnl=0.0
-        )
-        test_db.add(position)
-        await test_db.commit()
-
-        closed_position = await agent.close_position(
-            position=position,
-            exit_price=1.1100,
-            reason="Take profit hit"
-        )
-
-        assert closed_position.status == PositionStatus.CLOSED
-        assert closed_position.exit_price == 1.1100
-        # PnL = (1.1100 - 1.1000) * 1.0 = 0.01 * 1.0 = 100 pips
-        assert closed_position.realized_pnl == pytest.approx(0.01, rel=1e-6)
-
-    async def test_close_position_short(self, test_db, test_user):
-        """Test closing a short position."""
+    @pytest.mark.parametrize(
+        "side, stop_loss, take_profit, exit_price",
+        [
+            # PnL = (1.1100 - 1.1000) * 1.0 = 0.01 * 1.0 = 100 pips
+            (PositionSide.LONG, 1.0950, 1.1150, 1.1100),
+            # PnL = (1.1000 - 1.0900) * 1.0 = 0.01 * 1.0 = 100 pips
+            (PositionSide.SHORT, 1.1050, 1.0850, 1.0900),
+        ],
+        ids=["long", "short"],
+    )
+    async def test_close_position(
+        self, test_db, side, stop_loss, take_profit, exit_price
+    ):
+        """Test closing a position at take profit on either side."""
         agent = ExecutionAgent(db=test_db, system_mode=SystemMode.AUTONOMOUS)
 
-        position = Position(
-            user_id=test_user.id,
+        # close_position only mutates the object it is given - no DB row needed
+        position = MagicMock(
+            spec=Position,
+            id=1,
             strategy_name="NBB",
             symbol="EURUSD",
-            side=PositionSide.SHORT,
+            side=side,
             status=PositionStatus.OPEN,
             entry_price=1.1000,
             position_size=1.0,
-            entry_time=datetime.utcnow(),
-            stop_loss=1.1050,
-            take_profit=1.0850,
-            unrealized_pnl=0.0
+            stop_loss=stop_loss,
+            take_profit=take_profit,
         )
-        test_db.add(position)
-        await test_db.commit()
 
         closed_position = await agent.close_position(
             position=position,
-            exit_price=1.0900,
+            exit_price=exit_price,
             reason="Take profit hit"
         )
 
         assert closed_position.status == PositionStatus.CLOSED
-        assert closed_position.exit_price == 1.0900
-        # PnL = (1.1000 - 1.0900) * 1.0 = 0.01 * 1.0 = 100 pips
+        assert closed_position.exit_price == exit_price
         assert closed_position.realized_pnl == pytest.approx(0.01, rel=1e-6)
@@ -1,9 +1,52 @@
 import pytest
+import pytest_asyncio
 from httpx import AsyncClient
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.main import app
+from app.database import get_db
+from app.models.user import User
+
+SHARED_EMAIL = "shared_auth@test.com"
+
+
+@pytest_asyncio.fixture(scope="session")
+async def auth_tokens(test_engine, asgi_client: AsyncClient):
+    """
+    Register and log in one shared user once, returning its token pair.
+
+    The user is committed outside the per-test transaction so it survives
+    each test's rollback, and is deleted again at session end.
+    """
+    async with AsyncSession(test_engine, expire_on_commit=False) as session:
+        async def override_get_db():
+            yield session
+
+        app.dependency_overrides[get_db] = override_get_db
+        try:
+            await asgi_client.post(
+                "/api/v1/auth/register",
+                json={"email": SHARED_EMAIL, "password": "Test1234"}
+            )
+            login = await asgi_client.post(
+                "/api/v1/auth/login",
+                json={"email": SHARED_EMAIL, "password": "Test1234"}
+            )
+        finally:
+            asgi_client.cookies.clear()
+            app.dependency_overrides.clear()
+
+    try:
+        yield login.json()
+    finally:
+        async with AsyncSession(test_engine) as session:
+            await session.execute(delete(User).where(User.email == SHARED_EMAIL))
+            await session.commit()
 
 
 @pytest.mark.asyncio
-async def test_register(client: AsyncClient):
+async def test_register_and_duplicate_email(client: AsyncClient):
     r = await client.post(
         "/api/v1/auth/register",
         json={"email": "test@test.com", "password": "Test1234"}
@@ -11,16 +54,9 @@ async def test_register(client: AsyncClient):
     assert r.status_code == 201
     assert r.json()["email"] == "test@test.com"
 
-
-@pytest.mark.asyncio
-async def test_register_duplicate_email(client: AsyncClient):
-    await client.post(
-        "/api/v1/auth/register",
-        json={"email": "dupe@test.com", "password": "Test1234"}
-    )
     r = await client.post(
         "/api/v1/auth/register",
-        json={"email": "dupe@test.com", "password": "Test1234"}
+        json={"email": "test@test.com", "password": "Test1234"}
     )
     assert r.status_code == 400
 
@@ -54,22 +90,13 @@ async def test_login_wrong_password(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_me(client: AsyncClient):
-    await client.post(
-        "/api/v1/auth/register",
-        json={"email": "me@test.com", "password": "Test1234"}
-    )
-    login = await client.post(
-        "/api/v1/auth/login",
-        json={"email": "me@test.com", "password": "Test1234"}
-    )
-    token = login.json()["access_token"]
+async def test_me(client: AsyncClient, auth_tokens: dict):
     r = await client.get(
         "/api/v1/auth/me",
-        headers={"Authorization": f"Bearer {token}"}
+        headers={"Authorization": f"Bearer {auth_tokens['access_token']}"}
     )
     assert r.status_code == 200
-    assert r.json()["email"] == "me@test.com"
+    assert r.json()["email"] == SHARED_EMAIL
 
 
 @pytest.mark.asyncio
@@ -79,19 +106,10 @@ async def test_me_unauthorized(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_refresh_token(client: AsyncClient):
-    await client.post(
-        "/api/v1/auth/register",
-        json={"email": "refresh@test.com", "password": "Test1234"}
-    )
-    login = await client.post(
-        "/api/v1/auth/login",
-        json={"email": "refresh@test.com", "password": "Test1234"}
-    )
-    refresh_token = login.json()["refresh_token"]
+async def test_refresh_token(client: AsyncClient, auth_tokens: dict):
     r = await client.post(
         "/api/v1/auth/refresh",
-        json={"refresh_token": refresh_token}
+        json={"refresh_token": auth_tokens["refresh_token"]}
     )
     assert r.status_code == 200
     assert "access_token" in r.json()
@@ -4,6 +4,7 @@ Unit tests for backtest engine.
 Prompt 05 - Backtest Engine.
 """
 
+import numpy as np
 import pytest
 from datetime import datetime, timedelta
 
@@ -14,13 +15,41 @@ from app.backtest.portfolio import (
     EquityPoint,
     TradeSide,
 )
-from app.backtest.performance import PerformanceMetrics
+from app.backtest.performance import PerformanceMetrics, _TradeArrays
 
 
 # ============================================================================
 # Portfolio Tests
 # ============================================================================
 
+ENTRY_TIME = datetime(2024, 1, 1, 10, 0, 0)
+EXIT_TIME = datetime(2024, 1, 1, 14, 0, 0)
+
+
+def trades_from_pnls(pnls: list[float]) -> list[Trade]:
+    """Build minimal closed EUR/USD trades carrying only the given P&L values."""
+    return [
+        Trade(
+            symbol="EUR/USD",
+            side=TradeSide.LONG,
+            entry_price=1.1,
+            exit_price=1.1 + pnl / 1000,
+            quantity=100,
+            entry_time=ENTRY_TIME,
+            exit_time=EXIT_TIME,
+            pnl=pnl,
+            pnl_percent=pnl / 1000,
+        )
+        for pnl in pnls
+    ]
+
+
+@pytest.fixture
+def portfolio_no_commission():
+    """Fresh commission-free portfolio with a 10k balance."""
+    return Portfolio(initial_balance=10000.0, commission_rate=0.0)
+
+
 class TestPortfolio:
     """Tests for the Portfolio class."""
 
@@ -75,54 +104,42 @@ class TestPortfolio:
         assert position is None
         assert len(portfolio.positions) == 0
 
-    def test_close_position_profit(self):
-        """Test closing position with profit."""
-        portfolio = Portfolio(initial_balance=10000.0, commission_rate=0.0)
-        entry_time = datetime(2024, 1, 1, 10, 0, 0)
-        exit_time = datetime(2024, 1, 1, 14, 0, 0)
-        
+    @pytest.mark.parametrize(
+        "side, exit_price, expected_pnl, expected_pnl_percent",
+        [
+            # 100 pip profit: (1.1100 - 1.1000) * 1000
+            (TradeSide.LONG, 1.1100, 10.0, 0.009090909),
+            # 100 pip loss: (1.0900 - 1.1000) * 1000
+            (TradeSide.LONG, 1.0900, -10.0, -0.009090909),
+            # Price drops = profit for short: (1.1000 - 1.0900) * 1000
+            (TradeSide.SHORT, 1.0900, 10.0, 0.009090909),
+        ],
+        ids=["long_profit", "long_loss", "short_profit"],
+    )
+    def test_close_position(
+        self, portfolio_no_commission, side, exit_price, expected_pnl, expected_pnl_percent
+    ):
+        """Test closing positions and the resulting P&L on either side."""
+        portfolio = portfolio_no_commission
         position = portfolio.open_position(
             symbol="EUR/USD",
-            side=TradeSide.LONG,
+            side=side,
             entry_price=1.1000,
             quantity=1000,
-            entry_time=entry_time,
+            entry_time=ENTRY_TIME,
         )
         
         trade = portfolio.close_position(
             position=position,
-            exit_price=1.1100,  # 100 pip profit
-            exit_time=exit_time,
+            exit_price=exit_price,
+            exit_time=EXIT_TIME,
         )
         
-        assert trade.pnl == pytest.approx(10.0, rel=0.001)  # (1.1100 - 1.1000) * 1000
-        assert trade.pnl_percent == pytest.approx(0.009090909, rel=0.001)
+        assert trade.pnl == pytest.approx(expected_pnl, rel=0.001)
+        assert trade.pnl_percent == pytest.approx(expected_pnl_percent, rel=0.001)
         assert len(portfolio.positions) == 0
         assert len(portfolio.trades) == 1
 
-    def test_close_position_loss(self):
-        """Test closing position with loss."""
-        portfolio = Portfolio(initial_balance=10000.0, commission_rate=0.0)
-        entry_time = datetime(2024, 1, 1, 10, 0, 0)
-        exit_time = datetime(2024, 1, 1, 14, 0, 0)
-        
-        position = portfolio.open_position(
-            symbol="EUR/USD",
-            side=TradeSide.LONG,
-            entry_price=1.1000,
-            quantity=1000,
-            entry_time=entry_time,
-        )
-        
-        trade = portfolio.close_position(
-            position=position,
-            exit_price=1.0900,  # 100 pip loss
-            exit_time=exit_time,
-        )
-        
-        assert trade.pnl == pytest.approx(-10.0, rel=0.001)  # (1.0900 - 1.1000) * 1000
-        assert len(portfolio.trades) == 1
-
     def test_stop_loss_trigger_long(self):
         """Test stop-loss triggers for long position."""
         portfolio = Portfolio(initial_balance=10000.0, commission_rate=0.0)
@@ -173,29 +190,6 @@ class TestPortfolio:
         assert closed[0].exit_price == 1.1100  # Closed at TP price
         assert closed[0].pnl == pytest.approx(10.0, rel=0.001)  # 100 pips profit
 
-    def test_short_position_pnl(self):
-        """Test P&L calculation for short positions."""
-        portfolio = Portfolio(initial_balance=10000.0, commission_rate=0.0)
-        entry_time = datetime(2024, 1, 1, 10, 0, 0)
-        exit_time = datetime(2024, 1, 1, 14, 0, 0)
-        
-        position = portfolio.open_position(
-            symbol="EUR/USD",
-            side=TradeSide.SHORT,
-            entry_price=1.1000,
-            quantity=1000,
-            entry_time=entry_time,
-        )
-        
-        # Price drops = profit for short
-        trade = portfolio.close_position(
-            position=position,
-            exit_price=1.0900,
-            exit_time=exit_time,
-        )
-        
-        assert trade.pnl == pytest.approx(10.0, rel=0.001)  # (1.1000 - 1.0900) * 1000
-
     def test_equity_curve_update(self):
         """Test equity curve updates correctly."""
         portfolio = Portfolio(initial_balance=10000.0, commission_rate=0.0)
@@ -226,35 +220,7 @@ class TestPortfolio:
         portfolio = Portfolio(initial_balance=10000.0, commission_rate=0.0)
         
         # Add 3 winning and 2 losing trades
-        for i in range(3):
-            portfolio.trades.append(
-                Trade(
-                    symbol="EUR/USD",
-                    side=TradeSide.LONG,
-                    entry_price=1.1,
-                    exit_price=1.11,
-                    quantity=100,
-                    entry_time=datetime.now(),
-                    exit_time=datetime.now(),
-                    pnl=10.0,
-                    pnl_percent=0.01,
-                )
-            )
-        
-        for i in range(2):
-            portfolio.trades.append(
-                Trade(
-                    symbol="EUR/USD",
-                    side=TradeSide.LONG,
-                    entry_price=1.1,
-                    exit_price=1.09,
-                    quantity=100,
-                    entry_time=datetime.now(),
-                    exit_time=datetime.now(),
-                    pnl=-10.0,
-                    pnl_percent=-0.01,
-                )
-            )
+        portfolio.trades.extend(trades_from_pnls([10.0] * 3 + [-10.0] * 2))
         
         assert portfolio.win_rate == pytest.approx(0.6, rel=0.001)  # 3/5
 
@@ -272,6 +238,9 @@ class TestPortfolio:
         ]
         
         assert portfolio.max_drawdown == pytest.approx(0.095238, rel=0.001)
+        equity = np.array([ep.equity for ep in portfolio.equity_curve])
+        drawdowns = Portfolio.drawdowns_from_equity(equity, portfolio.initial_balance)
+        assert drawdowns.max() == pytest.approx(portfolio.max_drawdown, rel=0.001)
 
 
 # ============================================================================
@@ -311,6 +280,8 @@ class TestPerformanceMetrics:
         assert metrics.winning_trades == 2
         assert metrics.losing_trades == 1
         assert metrics.win_rate == pytest.approx(0.6667, rel=0.01)
+        assert metrics.max_drawdown == pytest.approx(portfolio.max_drawdown, rel=0.01)
+        assert metrics.avg_drawdown == pytest.approx(0.0196, rel=0.01)
 
     def test_sharpe_ratio_calculation(self):
         """Test Sharpe ratio calculation."""
@@ -319,9 +290,8 @@ class TestPerformanceMetrics:
         
         sharpe = PerformanceMetrics._calculate_sharpe_ratio(returns, risk_free_rate=0.02)
         
-        # With these returns, should be positive
-        assert sharpe is not None
-        assert sharpe > 0
+        # mean 0.008, population std ~0.01030 -> (0.008 - 0.02/252) / std * sqrt(252)
+        assert sharpe == pytest.approx(12.2126, rel=0.001)
 
     def test_sharpe_ratio_insufficient_data(self):
         """Test Sharpe ratio with insufficient data returns None."""
@@ -337,7 +307,8 @@ class TestPerformanceMetrics:
         
         sortino = PerformanceMetrics._calculate_sortino_ratio(returns, risk_free_rate=0.02)
         
-        assert sortino is not None
+        # Downside variance is averaged over all 5 returns, not just the 2 negatives
+        assert sortino == pytest.approx(18.7974, rel=0.001)
 
     def test_sortino_ratio_no_negative_returns(self):
         """Test Sortino ratio with no negative returns returns None."""
@@ -350,12 +321,12 @@ class TestPerformanceMetrics:
     def test_profit_factor_calculation(self):
         """Test profit factor calculation."""
         trades = [
-            Trade("X", TradeSide.LONG, 1.0, 1.1, 100, datetime.now(), datetime.now(), 100.0, 0.1),
-            Trade("X", TradeSide.LONG, 1.0, 1.1, 100, datetime.now(), datetime.now(), 200.0, 0.2),
-            Trade("X", TradeSide.LONG, 1.0, 0.9, 100, datetime.now(), datetime.now(), -50.0, -0.05),
+            Trade("X", TradeSide.LONG, 1.0, 1.1, 100, ENTRY_TIME, EXIT_TIME, 100.0, 0.1),
+            Trade("X", TradeSide.LONG, 1.0, 1.1, 100, ENTRY_TIME, EXIT_TIME, 200.0, 0.2),
+            Trade("X", TradeSide.LONG, 1.0, 0.9, 100, ENTRY_TIME, EXIT_TIME, -50.0, -0.05),
         ]
         
-        pf = PerformanceMetrics._calculate_profit_factor(trades)
+        pf = PerformanceMetrics._calculate_profit_factor(_TradeArrays.from_trades(trades).pnl)
         
         # Gross profit = 300, Gross loss = 50
         assert pf == pytest.approx(6.0, rel=0.01)
@@ -363,11 +334,11 @@ class TestPerformanceMetrics:
     def test_profit_factor_no_losses(self):
         """Test profit factor with no losing trades returns None."""
         trades = [
-            Trade("X", TradeSide.LONG, 1.0, 1.1, 100, datetime.now(), datetime.now(), 100.0, 0.1),
-            Trade("X", TradeSide.LONG, 1.0, 1.1, 100, datetime.now(), datetime.now(), 200.0, 0.2),
+            Trade("X", TradeSide.LONG, 1.0, 1.1, 100, ENTRY_TIME, EXIT_TIME, 100.0, 0.1),
+            Trade("X", TradeSide.LONG, 1.0, 1.1, 100, ENTRY_TIME, EXIT_TIME, 200.0, 0.2),
         ]
         
-        pf = PerformanceMetrics._calculate_profit_factor(trades)
+        pf = PerformanceMetrics._calculate_profit_factor(_TradeArrays.from_trades(trades).pnl)
         
         assert pf is None
 
@@ -392,7 +363,9 @@ class TestPerformanceMetrics:
                   datetime(2024, 1, 2, 10, 0), datetime(2024, 1, 2, 12, 0), 10.0, 0.1),  # 2 hours
         ]
         
-        avg_duration = PerformanceMetrics._calculate_avg_trade_duration(trades)
+        avg_duration = PerformanceMetrics._calculate_avg_trade_duration(
+            _TradeArrays.from_trades(trades).durations
+        )
         
         assert avg_duration == pytest.approx(3.0, rel=0.01)  # 3 hours average
 
@@ -423,11 +396,11 @@ class TestPerformanceMetrics:
         portfolio = Portfolio(initial_balance=10000.0)
         portfolio.equity = 11000.0
         portfolio.trades = [
-            Trade("X", TradeSide.LONG, 1.0, 1.1, 100, datetime.now(), datetime.now(), 100.0, 0.1),
+            Trade("X", TradeSide.LONG, 1.0, 1.1, 100, ENTRY_TIME, EXIT_TIME, 100.0, 0.1),
         ]
         portfolio.equity_curve = [
-            EquityPoint(datetime.now(), 10000.0, 0.0),
-            EquityPoint(datetime.now(), 11000.0, 0.0),
+            EquityPoint(ENTRY_TIME, 10000.0, 0.0),
+            EquityPoint(ENTRY_TIME, 11000.0, 0.0),
         ]
         
         metrics = PerformanceMetrics.from_portfolio(portfolio)
@@ -442,8 +415,8 @@ class TestPerformanceMetrics:
         portfolio = Portfolio(initial_balance=10000.0)
         portfolio.equity = 11000.0
         portfolio.equity_curve = [
-            EquityPoint(datetime.now(), 10000.0, 0.0),
-            EquityPoint(datetime.now(), 11000.0, 0.0),
+            EquityPoint(ENTRY_TIME, 10000.0, 0.0),
+            EquityPoint(ENTRY_TIME, 11000.0, 0.0),
         ]
         
         metrics = PerformanceMetrics.from_portfolio(portfolio)
@@ -469,7 +442,7 @@ class TestOpenPosition:
             side=TradeSide.LONG,
             entry_price=1.1000,
             quantity=1000,
-            entry_time=datetime.now(),
+            entry_time=ENTRY_TIME,
         )
         
         pnl = position.unrealized_pnl(current_price=1.1050)
@@ -483,7 +456,7 @@ class TestOpenPosition:
             side=TradeSide.SHORT,
             entry_price=1.1000,
             quantity=1000,
-            entry_time=datetime.now(),
+            entry_time=ENTRY_TIME,
         )
         
         pnl = position.unrealized_pnl(current_price=1.0950)
@@ -497,7 +470,7 @@ class TestOpenPosition:
             side=TradeSide.LONG,
             entry_price=1.1000,
             quantity=1000,
-            entry_time=datetime.now(),
+            entry_time=ENTRY_TIME,
         )
         
         pnl_pct = position.unrealized_pnl_percent(current_price=1.1100)
@@ -1,14 +1,23 @@
+import asyncio
 import pytest
 import pytest_asyncio
 from unittest.mock import AsyncMock, patch, MagicMock
 from datetime import datetime, timezone
 
+from app.config import settings
 from app.data.twelvedata_client import TwelveDataClient, RateLimiter
 
 
 class TestRateLimiter:
+    @pytest.fixture
+    def frozen_clock(self):
+        """Pin time.monotonic so no tokens are refilled between acquires."""
+        with patch("app.data.twelvedata_client.time") as mock_time:
+            mock_time.monotonic.return_value = 1000.0
+            yield
+
     @pytest.mark.asyncio
-    async def test_acquire_token_available(self):
+    async def test_acquire_token_available(self, frozen_clock):
         limiter = RateLimiter(max_requests=10, time_window=60)
         assert limiter.tokens == 10
 
@@ -16,7 +25,7 @@ class TestRateLimiter:
         assert limiter.tokens == 9
 
     @pytest.mark.asyncio
-    async def test_acquire_multiple_tokens(self):
+    async def test_acquire_multiple_tokens(self, frozen_clock):
         limiter = RateLimiter(max_requests=5, time_window=60)
 
         for i in range(5):
@@ -24,6 +33,53 @@ class TestRateLimiter:
 
         assert limiter.tokens == 0
 
+    @pytest.mark.asyncio
+    async def test_tokens_refill_with_elapsed_time(self):
+        with patch("app.data.twelvedata_client.time") as mock_time:
+            mock_time.monotonic.return_value = 1000.0
+            limiter = RateLimiter(max_requests=6, time_window=60)
+            for _ in range(6):
+                await limiter.acquire()
+
+            # 6 per minute = one token every 10s; capped at max_requests
+            mock_time.monotonic.return_value = 1025.0
+            limiter._refill()
+            assert limiter.tokens == pytest.approx(2.5)
+
+            mock_time.monotonic.return_value = 2000.0
+            limiter._refill()
+            assert limiter.tokens == 6
+
+    @pytest.mark.asyncio
+    async def test_concurrent_waiters_sleep_in_parallel(self):
+        """Callers blocked on an empty bucket sleep concurrently, not one after another."""
+        real_sleep = asyncio.sleep
+        wake = asyncio.Event()
+        sleeping = []
+
+        async def fake_sleep(delay):
+            sleeping.append(delay)
+            await wake.wait()
+
+        with patch("app.data.twelvedata_client.time") as mock_time, \
+                patch.object(asyncio, "sleep", fake_sleep):
+            mock_time.monotonic.return_value = 1000.0
+            limiter = RateLimiter(max_requests=3, time_window=60)
+            for _ in range(3):
+                await limiter.acquire()
+
+            waiters = [asyncio.create_task(limiter.acquire()) for _ in range(3)]
+            for _ in range(10):
+                await real_sleep(0)
+
+            # All three are asleep at once; sleeping under the lock would admit one
+            assert sleeping == [20.0, 20.0, 20.0]
+
+            mock_time.monotonic.return_value = 1060.0
+            wake.set()
+            await asyncio.wait_for(asyncio.gather(*waiters), timeout=1)
+
+        assert limiter.tokens == 0
 
 class TestTwelveDataClient:
     @pytest_asyncio.fixture
@@ -47,6 +103,19 @@ class TestTwelveDataClient:
         assert client._session is None
         assert client.redis_client is None
 
+    @pytest.mark.asyncio
+    async def test_connect_reuses_pooled_session(self, mock_client):
+        """Repeated connects keep the same keep-alive session instead of opening a new one."""
+        await mock_client.connect()
+        session = mock_client._session
+        await mock_client.connect()
+
+        assert mock_client._session is session
+        assert session.connector.limit == settings.twelvedata_pool_limit
+
+        await mock_client.close()
+        assert session.closed
+
     @pytest.mark.asyncio
     async def test_get_time_series_response_parsing(self, mock_client):
         """Test that time series data is correctly parsed."""
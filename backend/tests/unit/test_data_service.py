@@ -2,6 +2,7 @@ import pytest
 import pytest_asyncio
 from unittest.mock import AsyncMock, MagicMock
 from datetime import datetime, timezone
+from sqlalchemy.dialects import postgresql
 
 from app.data.data_service import DataService
 from app.models.market_data import Candle
@@ -15,6 +16,8 @@ class TestDataService:
         db.add = MagicMock()
         db.commit = AsyncMock()
         db.refresh = AsyncMock()
+        db.get_bind = MagicMock()
+        db.get_bind.return_value.dialect.name = "postgresql"
         return db
 
     @pytest_asyncio.fixture
@@ -37,16 +40,19 @@ class TestDataService:
             }
         ])
 
-        # Mock execute to return no existing candle
-        mock_result = AsyncMock()
-        mock_result.scalar_one_or_none = MagicMock(return_value=None)
+        # Mock the insert to report one new row
+        mock_result = MagicMock()
+        mock_result.rowcount = 1
         mock_db.execute = AsyncMock(return_value=mock_result)
 
         service = DataService(mock_db, mock_client)
         inserted = await service.fetch_and_store_candles("EURUSD", "1h")
 
         assert inserted == 1
-        mock_db.add.assert_called_once()
+        mock_db.execute.assert_called_once()
+        (stmt,), _ = mock_db.execute.call_args
+        compiled = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (symbol, interval, timestamp) DO NOTHING" in compiled
         mock_db.commit.assert_called_once()
 
     @pytest.mark.asyncio
@@ -63,17 +69,28 @@ class TestDataService:
             }
         ])
 
-        # Mock execute to return existing candle
-        existing_candle = MagicMock(spec=Candle)
-        mock_result = AsyncMock()
-        mock_result.scalar_one_or_none = MagicMock(return_value=existing_candle)
+        # Mock the insert to report the row was dropped by the unique constraint
+        mock_result = MagicMock()
+        mock_result.rowcount = 0
         mock_db.execute = AsyncMock(return_value=mock_result)
 
         service = DataService(mock_db, mock_client)
         inserted = await service.fetch_and_store_candles("EURUSD", "1h")
 
         assert inserted == 0
-        mock_db.add.assert_not_called()
+        mock_db.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_fetch_and_store_candles_unsupported_dialect(self, mock_db, mock_client):
+        """Test that dialects without ON CONFLICT support are rejected by name."""
+        mock_db.get_bind.return_value.dialect.name = "mysql"
+
+        service = DataService(mock_db, mock_client)
+        with pytest.raises(NotImplementedError, match="'mysql'"):
+            await service.fetch_and_store_candles("EURUSD", "1h")
+
+        mock_client.get_time_series.assert_not_called()
+        mock_db.execute.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_fetch_and_store_candles_empty_response(self, mock_db, mock_client):
@@ -93,10 +110,9 @@ class TestDataService:
             MagicMock(spec=Candle)
         ]
 
-        mock_scalars = MagicMock()
-        mock_scalars.all = MagicMock(return_value=mock_candles)
-        mock_result = AsyncMock()
-        mock_result.scalars = MagicMock(return_value=mock_scalars)
+        # Result/ScalarResult accessors are synchronous; only execute is awaited
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = mock_candles
         mock_db.execute = AsyncMock(return_value=mock_result)
 
         service = DataService(mock_db, mock_client)
@@ -114,8 +130,8 @@ class TestDataService:
     async def test_upsert_symbol_creates_new(self, mock_db, mock_client):
         """Test that new symbols are created."""
         # Mock execute to return no existing symbol
-        mock_result = AsyncMock()
-        mock_result.scalar_one_or_none = MagicMock(return_value=None)
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = None
         mock_db.execute = AsyncMock(return_value=mock_result)
 
         service = DataService(mock_db, mock_client)
@@ -327,26 +327,34 @@ class TestExecutionEngine:
     """Test execution engine functionality."""
     
     @pytest.fixture
-    async def test_signal(self, test_db: AsyncSession) -> Signal:
-        """Create test signal."""
-        signal = Signal(
-            strategy_name="test_strategy",
-            symbol="AAPL",
-            signal_type=SignalType.LONG,
-            status=SignalStatus.PENDING,
-            entry_price=150.00,
-            stop_loss=145.00,
-            take_profit=160.00,
-            risk_percent=1.0,
-            position_size=10.0,
-            timeframe="H1",
-            confidence=85.0,
-            signal_time=datetime.utcnow(),
-        )
-        test_db.add(signal)
-        await test_db.commit()
-        await test_db.refresh(signal)
-        return signal
+    async def seeded_signals(
+        self,
+        test_db: AsyncSession,
+        test_user,
+    ) -> dict[SignalStatus, Signal]:
+        """Insert one signal per status in a single flush, keyed by status."""
+        signal_time = datetime.utcnow()
+        signals = {
+            status: Signal(
+                user_id=test_user.id,
+                strategy_name="test_strategy",
+                symbol="AAPL",
+                signal_type=SignalType.LONG,
+                status=status,
+                entry_price=150.00,
+                stop_loss=145.00,
+                take_profit=160.00,
+                risk_percent=1.0,
+                position_size=10.0,
+                timeframe="H1",
+                confidence=85.0,
+                signal_time=signal_time,
+            )
+            for status in (SignalStatus.PENDING, SignalStatus.CANCELLED, SignalStatus.EXPIRED)
+        }
+        test_db.add_all(signals.values())
+        await test_db.flush()
+        return signals
     
     @pytest.mark.asyncio
     async def test_execution_engine_default_mode(self, test_db: AsyncSession):
@@ -369,28 +377,10 @@ class TestExecutionEngine:
     async def test_execution_guide_mode_blocks_execution(
         self,
         test_db: AsyncSession,
-        test_user,
+        seeded_signals,
     ):
         """Test GUIDE mode blocks actual execution."""
-        # Create test signal inline
-        signal = Signal(
-            user_id=test_user.id,
-            strategy_name="test_strategy",
-            symbol="AAPL",
-            signal_type=SignalType.LONG,
-            status=SignalStatus.PENDING,
-            entry_price=150.00,
-            stop_loss=145.00,
-            take_profit=160.00,
-            risk_percent=1.0,
-            position_size=10.0,
-            timeframe="H1",
-            confidence=85.0,
-            signal_time=datetime.utcnow(),
-        )
-        test_db.add(signal)
-        await test_db.commit()
-        await test_db.refresh(signal)
+        signal = seeded_signals[SignalStatus.PENDING]
         
         engine = ExecutionEngine(test_db)
         engine.set_mode(ExecutionMode.GUIDE)
@@ -426,27 +416,10 @@ class TestExecutionEngine:
     async def test_execution_cancelled_signal_rejected(
         self,
         test_db: AsyncSession,
-        test_user,
+        seeded_signals,
     ):
         """Test execution rejects cancelled signal."""
-        # Create cancelled signal
-        signal = Signal(
-            user_id=test_user.id,
-            strategy_name="test_strategy",
-            symbol="AAPL",
-            signal_type=SignalType.LONG,
-            status=SignalStatus.CANCELLED,
-            entry_price=150.00,
-            stop_loss=145.00,
-            take_profit=160.00,
-            risk_percent=1.0,
-            timeframe="H1",
-            confidence=85.0,
-            signal_time=datetime.utcnow(),
-        )
-        test_db.add(signal)
-        await test_db.commit()
-        await test_db.refresh(signal)
+        signal = seeded_signals[SignalStatus.CANCELLED]
         
         engine = ExecutionEngine(test_db)
         result = await engine.execute_signal(signal.id)
@@ -458,26 +431,10 @@ class TestExecutionEngine:
     async def test_execution_expired_signal_rejected(
         self,
         test_db: AsyncSession,
-        test_user,
+        seeded_signals,
     ):
         """Test execution rejects expired signal."""
-        signal = Signal(
-            user_id=test_user.id,
-            strategy_name="test_strategy",
-            symbol="AAPL",
-            signal_type=SignalType.LONG,
-            status=SignalStatus.EXPIRED,
-            entry_price=150.00,
-            stop_loss=145.00,
-            take_profit=160.00,
-            risk_percent=1.0,
-            timeframe="H1",
-            confidence=85.0,
-            signal_time=datetime.utcnow(),
-        )
-        test_db.add(signal)
-        await test_db.commit()
-        await test_db.refresh(signal)
+        signal = seeded_signals[SignalStatus.EXPIRED]
         
         engine = ExecutionEngine(test_db)
         result = await engine.execute_signal(signal.id)
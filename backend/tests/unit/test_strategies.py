@@ -183,6 +183,42 @@ class TestToriStrategy:
         assert "resistance" in fib_levels
         assert len(fib_levels["support"]) == 3  # 38.2%, 50%, 61.8%
 
+    @pytest.mark.asyncio
+    async def test_fibonacci_levels_follow_tip_revisions(self, mock_db):
+        strategy = ToriStrategy(
+            config=ToriStrategy.get_default_config(ToriStrategy),
+            db=mock_db
+        )
+
+        candles = create_candles(60)
+        original_high = candles[-1].high
+        first = strategy._calculate_fibonacci_levels(candles)
+
+        # A spike on the live candle widens the range...
+        candles[-1].high = 1.2000
+        spiked = strategy._calculate_fibonacci_levels(candles)
+        assert spiked != first
+
+        # ...and revising it back restores the original levels
+        candles[-1].high = original_high
+        assert strategy._calculate_fibonacci_levels(candles) == first
+
+    @pytest.mark.asyncio
+    async def test_find_swings(self, mock_db):
+        strategy = ToriStrategy(
+            config=ToriStrategy.get_default_config(ToriStrategy),
+            db=mock_db
+        )
+
+        candles = create_candles(11)
+        candles[5].high = 2.0
+        candles[5].low = 0.5
+
+        swing_highs, swing_lows = strategy._find_swings(candles, 3)
+
+        assert swing_highs == [(5, 2.0)]
+        assert swing_lows == [(5, 0.5)]
+
 
 class TestStrategyManager:
     @pytest_asyncio.fixture